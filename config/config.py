@@ -38,6 +38,10 @@ class Config:
     def DEFAULT_TIMEOUT(self):
         return self.data_manager.get_setting('DEFAULT_TIMEOUT', 30)
     
+    @property
+    def LOGIN_TIMEOUT(self):
+        return self.data_manager.get_setting('LOGIN_TIMEOUT', 10)
+    
     @property
     def SCREENSHOT_ON_FAILURE(self):
         return self.data_manager.get_setting('SCREENSHOT_ON_FAILURE', True)
@@ -50,6 +54,14 @@ class Config:
     def POS_TITLE_REGEX(self):
         return self.data_manager.get_setting('POS_TITLE_REGEX', '.*POS.*')
     
+    @property
+    def SUPPORTS_QTY_MULTIPLIER(self):
+        return self.data_manager.get_setting('SUPPORTS_QTY_MULTIPLIER', False)
+    
+    @property
+    def EAN_FIELD_AUTO_ID(self):
+        return self.data_manager.get_setting('EAN_FIELD_AUTO_ID', '')
+    
     # Dynamic data methods for scenarios
     def get_scenario_data(self, scenario_name: str):
         """Get all data for a specific test scenario"""
@@ -21,6 +21,7 @@ class CSVDataManager:
         
         # Cache for loaded data
         self._scenarios_cache = None
+        self._scenarios_by_name = None
         self._settings_cache = None
     
     def load_scenarios(self) -> List[Dict[str, Any]]:
@@ -40,6 +41,7 @@ class CSVDataManager:
                             row['quantity'] = int(row['quantity'])
                         
                         self._scenarios_cache.append(row)
+                self._scenarios_by_name = {row['scenario_name']: row for row in self._scenarios_cache}
                 print(f"Loaded {len(self._scenarios_cache)} scenarios from CSV")
             except FileNotFoundError:
                 print(f"Scenarios file not found: {self.scenarios_file}")
@@ -83,11 +85,11 @@ class CSVDataManager:
     
     def get_scenario_data(self, scenario_name: str) -> Optional[Dict[str, Any]]:
         """Get data for a specific scenario"""
-        scenarios = self.load_scenarios()
-        for scenario in scenarios:
-            if scenario['scenario_name'] == scenario_name:
-                print(f"[SUCCESS] Found data for scenario: {scenario_name}")
-                return scenario
+        self.load_scenarios()
+        scenario = (self._scenarios_by_name or {}).get(scenario_name)
+        if scenario is not None:
+            print(f"[SUCCESS] Found data for scenario: {scenario_name}")
+            return scenario
         
         print(f"[ERROR] No data found for scenario: {scenario_name}")
         return None
@@ -117,6 +119,7 @@ class CSVDataManager:
             
             # Clear cache to reload data
             self._scenarios_cache = None
+            self._scenarios_by_name = None
             print(f"[SUCCESS] Added new scenario: {scenario_data['scenario_name']}")
             return True
             
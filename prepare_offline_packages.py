@@ -9,6 +9,7 @@ import os
 import sys
 import subprocess
 import logging
+import threading
 from pathlib import Path
 import json
 
@@ -30,6 +31,10 @@ class OfflinePackageDownloader:
         self.requirements_file = self.base_dir / "requirements.txt"
         self.offline_dir = self.base_dir / "offline_packages"
         self.download_log = []
+        self.wheel_files = []
+        self.tar_files = []
+        self._net_probe = None
+        self._net_error = None
         
     def log_step(self, message, success=True):
         """Log download step with ASCII-only output"""
@@ -41,16 +46,33 @@ class OfflinePackageDownloader:
             "success": success
         })
         
-    def check_internet_connection(self):
-        """Check if internet connection is available"""
+    def _probe_internet(self):
+        """Background worker for start_connection_probe"""
         try:
             import urllib.request
             urllib.request.urlopen('https://pypi.org', timeout=10)
-            self.log_step("Internet connection verified")
-            return True
         except Exception as e:
-            self.log_step(f"No internet connection: {e}", False)
+            self._net_error = e
+    
+    def start_connection_probe(self):
+        """Start the PyPI connectivity probe in the background"""
+        if self._net_probe is None:
+            self._net_error = None
+            self._net_probe = threading.Thread(target=self._probe_internet, daemon=True)
+            self._net_probe.start()
+    
+    def check_internet_connection(self):
+        """Check if internet connection is available"""
+        self.start_connection_probe()
+        self._net_probe.join(timeout=15)
+        if self._net_probe.is_alive():
+            self.log_step("No internet connection: probe timed out", False)
+            return False
+        if self._net_error is not None:
+            self.log_step(f"No internet connection: {self._net_error}", False)
             return False
+        self.log_step("Internet connection verified")
+        return True
     
     def setup_offline_directory(self):
         """Create offline packages directory"""
@@ -76,7 +98,7 @@ class OfflinePackageDownloader:
                 sys.executable, "-m", "pip", "download",
                 "-r", str(self.requirements_file),
                 "--dest", str(self.offline_dir),
-                "--prefer-binary"
+                "--only-binary=:all:"
             ]
             
             result = subprocess.run(
@@ -104,8 +126,10 @@ class OfflinePackageDownloader:
     def verify_downloads(self):
         """Verify that packages were downloaded"""
         try:
-            wheel_files = list(self.offline_dir.glob("*.whl"))
-            tar_files = list(self.offline_dir.glob("*.tar.gz"))
+            wheel_files = sorted(self.offline_dir.glob("*.whl"))
+            tar_files = sorted(self.offline_dir.glob("*.tar.gz"))
+            self.wheel_files = wheel_files
+            self.tar_files = tar_files
             
             total_files = len(wheel_files) + len(tar_files)
             
@@ -131,6 +155,12 @@ class OfflinePackageDownloader:
     def create_offline_installer(self):
         """Create a simple offline installer script"""
         try:
+            # Bake the verified package list into the installer so the target
+            # machine installs exactly these files, in a fixed order
+            package_lists = (
+                f"WHEELS = {[p.name for p in self.wheel_files]!r}\n"
+                f"TARS = {[p.name for p in self.tar_files]!r}\n"
+            )
             installer_content = '''#!/usr/bin/env python3
 """
 Offline Package Installer
@@ -141,11 +171,13 @@ import sys
 import subprocess
 from pathlib import Path
 
+''' + package_lists + '''
+
 def install_offline_packages():
     """Install packages from offline directory"""
     offline_dir = Path(__file__).parent
-    wheel_files = list(offline_dir.glob("*.whl"))
-    tar_files = list(offline_dir.glob("*.tar.gz"))
+    wheel_files = [offline_dir / name for name in WHEELS]
+    tar_files = [offline_dir / name for name in TARS]
     
     if not wheel_files and not tar_files:
         print("[ERROR] No package files found")
@@ -291,17 +323,20 @@ This offline package set includes all dependencies for:
         print("=" * 60)
         print()
         
-        # Step 1: Check internet connection
-        if not self.check_internet_connection():
-            print("\n[ERROR] No internet connection available")
-            print("This script must be run on a machine with internet access")
-            return False
+        # Probe connectivity in the background while the directory is prepared
+        self.start_connection_probe()
         
-        # Step 2: Setup offline directory
+        # Step 1: Setup offline directory
         if not self.setup_offline_directory():
             print("\n[ERROR] Could not create offline directory")
             return False
         
+        # Step 2: Check internet connection
+        if not self.check_internet_connection():
+            print("\n[ERROR] No internet connection available")
+            print("This script must be run on a machine with internet access")
+            return False
+        
         # Step 3: Download packages
         if not self.download_packages():
             print("\n[ERROR] Package download failed")
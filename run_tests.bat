@@ -42,17 +42,17 @@ goto COMPLETE
 
 :RUN_BASIC
 echo Running Basic Cash Sale test...
-python run_tests.py test_01_basic_cash_sale
+python run_tests.py basic_cash_sale
 goto COMPLETE
 
 :RUN_PROMOTION
 echo Running Promotion Cash Sale test...
-python run_tests.py test_02_promotion_cash_sale
+python run_tests.py promotion_cash_sale
 goto COMPLETE
 
 :RUN_LOYALTY
 echo Running Loyalty Cash Sale test...
-python run_tests.py test_03_loyalty_cash_sale
+python run_tests.py loyalty_cash_sale
 goto COMPLETE
 
 :RUN_SMOKE
@@ -6,6 +6,14 @@ import sys
 import os
 from datetime import datetime
 
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_REPORTS_DIR = os.path.join(_SCRIPT_DIR, "reports")
+_LOGS_DIR = os.path.join(_SCRIPT_DIR, "logs")
+
+# Create reports/logs directories once at import
+os.makedirs(_REPORTS_DIR, exist_ok=True)
+os.makedirs(_LOGS_DIR, exist_ok=True)
+
 def run_tests():
     """Run all POS automation tests with HTML reporting."""
     
@@ -15,14 +23,6 @@ def run_tests():
     print(f"📅 Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
-    # Ensure we're in the correct directory
-    pywinauto_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(pywinauto_dir)
-    
-    # Create reports directory if it doesn't exist
-    os.makedirs("reports", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
-    
     # Generate timestamp for unique report names
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_name = f"reports/pos_automation_report_{timestamp}.html"
@@ -30,14 +30,16 @@ def run_tests():
     # Pytest command with all options
     pytest_cmd = [
         sys.executable, "-m", "pytest",
+        f"--rootdir={_SCRIPT_DIR}",
         "tests/pos_automation/",
         f"--html={report_name}",
         "--self-contained-html",
         "--tb=short",
         "-v",
-        "--capture=no",  # Show print statements in real-time
         f"--junitxml=reports/junit_report_{timestamp}.xml"
     ]
+    if os.environ.get("POS_VERBOSE"):
+        pytest_cmd.append("--capture=no")  # Show print statements in real-time
     
     print("🧪 Running POS automation test suite...")
     print(f"[REPORT] HTML Report will be saved to: {report_name}")
@@ -45,7 +47,7 @@ def run_tests():
     
     try:
         # Run pytest
-        result = subprocess.run(pytest_cmd, capture_output=False, text=True)
+        result = subprocess.run(pytest_cmd, cwd=_SCRIPT_DIR, capture_output=False, text=True)
         
         print()
         print("=" * 80)
@@ -59,7 +61,7 @@ def run_tests():
         else:
             print("[ERROR] Some tests failed. Check the report for details.")
         
-        print(f"[REPORT] View detailed report: {os.path.abspath(report_name)}")
+        print(f"[REPORT] View detailed report: {os.path.join(_SCRIPT_DIR, report_name)}")
         
         return result.returncode
         
@@ -68,33 +70,35 @@ def run_tests():
         return 1
 
 def run_specific_test(test_name):
-    """Run a specific test by name."""
+    """Run a specific test module, or a cash sale scenario by name."""
     
     print(f"[TARGET] Running specific test: {test_name}")
     
-    # Ensure we're in the correct directory
-    pywinauto_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(pywinauto_dir)
-    
-    # Create reports directory if it doesn't exist
-    os.makedirs("reports", exist_ok=True)
-    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_name = f"reports/{test_name}_report_{timestamp}.html"
     
+    test_path = os.path.join("tests", "pos_automation", f"{test_name}.py")
+    if os.path.exists(os.path.join(_SCRIPT_DIR, test_path)):
+        test_args = [test_path]
+    else:
+        # Scenario id of the parametrized cash sale test
+        test_args = [os.path.join("tests", "pos_automation", "test_cash_sale_scenarios.py"), "-k", test_name]
+    
     pytest_cmd = [
         sys.executable, "-m", "pytest",
-        f"tests/pos_automation/{test_name}.py",
+        f"--rootdir={_SCRIPT_DIR}",
+        *test_args,
         f"--html={report_name}",
         "--self-contained-html",
         "--tb=short",
-        "-v",
-        "--capture=no"
+        "-v"
     ]
+    if os.environ.get("POS_VERBOSE"):
+        pytest_cmd.append("--capture=no")  # Show print statements in real-time
     
     try:
-        result = subprocess.run(pytest_cmd, capture_output=False, text=True)
-        print(f"[REPORT] Report saved: {os.path.abspath(report_name)}")
+        result = subprocess.run(pytest_cmd, cwd=_SCRIPT_DIR, capture_output=False, text=True)
+        print(f"[REPORT] Report saved: {os.path.join(_SCRIPT_DIR, report_name)}")
         return result.returncode
     except Exception as e:
         print(f"[ERROR] Error running test: {e}")
@@ -7,50 +7,227 @@ Handles Git installation and GitHub configuration for Windows
 import os
 import sys
 import subprocess
-import webbrowser
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+_RULE = "=" * 60
+
+# Above this many changed paths, fall back to staging the whole tree
+MAX_EXPLICIT_ADD_PATHS = 50
+
+_GIT_INSTALL_BANNER = f"""
+{_RULE}
+GIT INSTALLATION REQUIRED
+{_RULE}
+
+Git is not installed on your machine. Please follow these steps:
+
+OPTION 1: Download from Git website (Recommended)
+1. Go to: https://git-scm.com/download/win
+2. Download the latest version
+3. Run installer with default settings
+4. Restart your command prompt
+5. Run this script again
+
+OPTION 2: Install using winget (if available)
+Run: winget install --id Git.Git -e --source winget
+
+"""
+
+_GIT_CONFIG_BANNER = f"""
+{_RULE}
+GIT CONFIGURATION
+{_RULE}
+
+Please provide your Git configuration:
+"""
+
+_SSH_BANNER = f"""
+{_RULE}
+SSH KEY SETUP
+{_RULE}
+
+"""
+
+_REPOSITORY_BANNER = f"""
+{_RULE}
+REPOSITORY SETUP
+{_RULE}
+
+"""
+
+_NEW_REPOSITORY_STEPS = """
+To create a new GitHub repository:
+1. Go to GitHub.com
+2. Click '+' > 'New repository'
+3. Name: pos-automation-framework
+4. Make it Private (recommended)
+5. Do NOT initialize with README
+6. Copy the repository URL
+"""
+
+_COMMIT_BANNER = f"""
+{_RULE}
+COMMIT AND PUSH
+{_RULE}
+
+"""
+
+_STATUS_BANNER = f"""
+{_RULE}
+SETUP VERIFICATION
+{_RULE}
+
+"""
+
+_SETUP_BANNER = f"""\
+{_RULE}
+POS Automation Framework - Git & GitHub Setup
+{_RULE}
+
+"""
+
+_SETUP_COMPLETE_BANNER = f"""
+{_RULE}
+GITHUB SETUP COMPLETED SUCCESSFULLY!
+{_RULE}
+
+Your POS Automation Framework is now:
+✓ Version controlled with Git
+✓ Connected to GitHub repository
+✓ Ready for collaboration
+✓ Backed up in the cloud
+
+Next steps:
+1. Check your repository on GitHub.com
+2. Set up branch protection (optional)
+3. Configure GitHub Actions (optional)
+4. Invite collaborators if needed
+"""
+
+_SSH_KEY_STEPS = """\
+1. Go to GitHub.com > Settings > SSH and GPG keys
+2. Click 'New SSH key'
+3. Paste the key above
+4. Give it a title like 'Windows-POS-Framework'
+"""
+
+def _read_git_config(*scope):
+    """Run one `git config --list` and parse it into a dict (last value wins)"""
+    config = {}
+    try:
+        result = subprocess.run(['git', 'config', *scope, '--list'],
+                              capture_output=True, text=True)
+        for line in result.stdout.splitlines():
+            key, sep, value = line.partition('=')
+            if sep:
+                config[key.lower()] = value
+    except FileNotFoundError:
+        pass
+    return config
+
+def _global_gitconfig_path():
+    """File `git config --global` writes to, resolved the way git does"""
+    if os.environ.get('GIT_CONFIG_GLOBAL'):
+        return Path(os.environ['GIT_CONFIG_GLOBAL'])
+    # git prefers HOME over the Windows profile directory
+    home = Path(os.environ['HOME']) if os.environ.get('HOME') else Path.home()
+    gitconfig = home / '.gitconfig'
+    xdg_config = Path(os.environ.get('XDG_CONFIG_HOME') or home / '.config') / 'git' / 'config'
+    if not gitconfig.exists() and xdg_config.exists():
+        return xdg_config
+    return gitconfig
+
+def _gitconfig_quote(value):
+    """Quote a value for a gitconfig file"""
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+def _format_remotes(config):
+    """Render remote.<name>.url entries the way `git remote -v` prints them"""
+    lines = []
+    for key, url in config.items():
+        if key.startswith('remote.') and key.endswith('.url'):
+            name = key[len('remote.'):-len('.url')]
+            push_url = config.get(f'remote.{name}.pushurl', url)
+            lines.append(f"{name}\t{url} (fetch)\n{name}\t{push_url} (push)\n")
+    return "".join(lines)
+
+def _porcelain_paths(output):
+    """Extract changed paths from `git status --porcelain -z` output"""
+    entries = output.split('\0')
+    paths = []
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        paths.append(entry[3:])
+        if entry[0] in 'RC' or entry[1] in 'RC':
+            # Skip the original path that follows a rename/copy; it is already staged
+            i += 1
+    return paths
+
 class GitHubSetup:
-    def __init__(self):
+    def __init__(self, verbose=False):
+        self.verbose = verbose
         self.git_installed = False
+        self.git_path = None
         self.git_configured = False
+        self.name = None
+        self.email = None
+        self._git_config_cache = None
+        self._git_effective_config_cache = None
         
-    def check_git_installation(self):
-        """Check if Git is installed"""
+    def git_global_config(self):
+        """Read global Git config once via `git config --list` and cache it"""
+        if self._git_config_cache is None:
+            self._git_config_cache = _read_git_config('--global')
+        return self._git_config_cache
+    
+    def git_config(self):
+        """Read effective Git config (user, remotes, ...) in one call and cache it"""
+        if self._git_effective_config_cache is None:
+            self._git_effective_config_cache = _read_git_config()
+        return self._git_effective_config_cache
+    
+    def is_git_repository(self):
+        """Check for a work tree with a single `git rev-parse` call"""
         try:
-            result = subprocess.run(['git', '--version'], 
+            result = subprocess.run(['git', 'rev-parse', '--is-inside-work-tree', '--git-dir'],
                                   capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"[SUCCESS] Git is installed: {result.stdout.strip()}")
-                self.git_installed = True
-                return True
         except FileNotFoundError:
-            pass
+            return False
+        output = result.stdout.split()
+        return result.returncode == 0 and output[:1] == ['true']
+    
+    def check_git_installation(self):
+        """Check if Git is installed"""
+        git_path = shutil.which('git')
+        if not git_path:
+            print("[ERROR] Git is not installed")
+            return False
         
-        print("[ERROR] Git is not installed")
-        return False
+        self.git_installed = True
+        self.git_path = git_path
+        if self.verbose:
+            # Only spawn git when the version is actually wanted
+            result = subprocess.run(['git', '--version'], 
+                                  capture_output=True, text=True)
+            print(f"[SUCCESS] Git is installed: {result.stdout.strip()}")
+        else:
+            print(f"[SUCCESS] Git is installed: {git_path}")
+        return True
     
     def install_git_instructions(self):
         """Provide Git installation instructions"""
-        print("\n" + "="*60)
-        print("GIT INSTALLATION REQUIRED")
-        print("="*60)
-        print()
-        print("Git is not installed on your machine. Please follow these steps:")
-        print()
-        print("OPTION 1: Download from Git website (Recommended)")
-        print("1. Go to: https://git-scm.com/download/win")
-        print("2. Download the latest version")
-        print("3. Run installer with default settings")
-        print("4. Restart your command prompt")
-        print("5. Run this script again")
-        print()
-        print("OPTION 2: Install using winget (if available)")
-        print("Run: winget install --id Git.Git -e --source winget")
-        print()
+        sys.stdout.write(_GIT_INSTALL_BANNER)
         
         choice = input("Open Git download page in browser? (y/N): ").lower()
         if choice == 'y':
+            import webbrowser
             webbrowser.open('https://git-scm.com/download/win')
         
         return False
@@ -61,7 +238,7 @@ class GitHubSetup:
             print("[INFO] Attempting to install Git using winget...")
             result = subprocess.run([
                 'winget', 'install', '--id', 'Git.Git', '-e', '--source', 'winget'
-            ], capture_output=True, text=True)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             if result.returncode == 0:
                 print("[SUCCESS] Git installed via winget")
@@ -78,15 +255,14 @@ class GitHubSetup:
         """Configure Git with user name and email"""
         try:
             # Check if already configured
-            name_result = subprocess.run(['git', 'config', '--global', 'user.name'], 
-                                       capture_output=True, text=True)
-            email_result = subprocess.run(['git', 'config', '--global', 'user.email'], 
-                                        capture_output=True, text=True)
+            config = self.git_global_config()
             
-            if name_result.returncode == 0 and email_result.returncode == 0:
+            if 'user.name' in config and 'user.email' in config:
+                self.name = config['user.name'].strip()
+                self.email = config['user.email'].strip()
                 print(f"[SUCCESS] Git already configured:")
-                print(f"  Name: {name_result.stdout.strip()}")
-                print(f"  Email: {email_result.stdout.strip()}")
+                print(f"  Name: {self.name}")
+                print(f"  Email: {self.email}")
                 self.git_configured = True
                 return True
                 
@@ -94,19 +270,20 @@ class GitHubSetup:
             pass
         
         # Configure Git
-        print("\n" + "="*60)
-        print("GIT CONFIGURATION")
-        print("="*60)
-        print()
-        print("Please provide your Git configuration:")
+        sys.stdout.write(_GIT_CONFIG_BANNER)
         
         name = input("Enter your name (for Git commits): ").strip()
         email = input("Enter your email address: ").strip()
         
         if name and email:
             try:
-                subprocess.run(['git', 'config', '--global', 'user.name', name], check=True)
-                subprocess.run(['git', 'config', '--global', 'user.email', email], check=True)
+                if not self._append_git_user(name, email):
+                    subprocess.run(['git', 'config', '--global', 'user.name', name], check=True)
+                    subprocess.run(['git', 'config', '--global', 'user.email', email], check=True)
+                    self._git_config_cache = None
+                    self._git_effective_config_cache = None
+                self.name = name
+                self.email = email
                 
                 print(f"[SUCCESS] Git configured successfully:")
                 print(f"  Name: {name}")
@@ -121,16 +298,36 @@ class GitHubSetup:
             print("[ERROR] Name and email are required")
             return False
     
+    def _append_git_user(self, name, email):
+        """Write user.name and user.email with one append to the global config
+        
+        Only used when neither key is set globally, so no value is duplicated.
+        The result is checked with a fresh `git config --global --list`; returns
+        False if the keys could not be written that way.
+        """
+        config = self.git_global_config()
+        if 'user.name' in config or 'user.email' in config:
+            return False
+        
+        try:
+            with open(_global_gitconfig_path(), 'a', encoding='utf-8') as f:
+                f.write(f"\n[user]\n\tname = {_gitconfig_quote(name)}\n"
+                        f"\temail = {_gitconfig_quote(email)}\n")
+        except OSError:
+            return False
+        
+        self._git_config_cache = None
+        self._git_effective_config_cache = None
+        config = self.git_global_config()
+        return config.get('user.name') == name and config.get('user.email') == email
+    
     def setup_ssh_key(self):
         """Set up SSH key for GitHub"""
         ssh_dir = Path.home() / '.ssh'
         ssh_key = ssh_dir / 'id_rsa'
         ssh_pub = ssh_dir / 'id_rsa.pub'
         
-        print("\n" + "="*60)
-        print("SSH KEY SETUP")
-        print("="*60)
-        print()
+        sys.stdout.write(_SSH_BANNER)
         
         setup_ssh = input("Set up SSH key for GitHub? (y/N): ").lower()
         if setup_ssh != 'y':
@@ -140,21 +337,18 @@ class GitHubSetup:
         if ssh_pub.exists():
             print("[INFO] SSH key already exists")
             try:
-                with open(ssh_pub, 'r') as f:
-                    public_key = f.read().strip()
+                public_key = ssh_pub.read_text().strip()
                 print("\nYour public SSH key:")
                 print("-" * 40)
                 print(public_key)
                 print("-" * 40)
                 print()
                 print("Copy this key to GitHub:")
-                print("1. Go to GitHub.com > Settings > SSH and GPG keys")
-                print("2. Click 'New SSH key'")
-                print("3. Paste the key above")
-                print("4. Give it a title like 'Windows-POS-Framework'")
+                sys.stdout.write(_SSH_KEY_STEPS)
                 
                 choice = input("\nOpen GitHub SSH settings page? (y/N): ").lower()
                 if choice == 'y':
+                    import webbrowser
                     webbrowser.open('https://github.com/settings/ssh/new')
                 
                 return True
@@ -165,8 +359,7 @@ class GitHubSetup:
         
         # Generate new SSH key
         print("[INFO] Generating new SSH key...")
-        email = subprocess.run(['git', 'config', '--global', 'user.email'], 
-                              capture_output=True, text=True).stdout.strip()
+        email = self.email or self.git_global_config().get('user.email', '').strip()
         
         try:
             ssh_dir.mkdir(exist_ok=True)
@@ -176,8 +369,7 @@ class GitHubSetup:
             ], check=True)
             
             if ssh_pub.exists():
-                with open(ssh_pub, 'r') as f:
-                    public_key = f.read().strip()
+                public_key = ssh_pub.read_text().strip()
                 
                 print("[SUCCESS] SSH key generated successfully")
                 print("\nYour public SSH key:")
@@ -186,13 +378,11 @@ class GitHubSetup:
                 print("-" * 40)
                 print()
                 print("IMPORTANT: Add this key to GitHub:")
-                print("1. Go to GitHub.com > Settings > SSH and GPG keys")
-                print("2. Click 'New SSH key'")
-                print("3. Paste the key above")
-                print("4. Give it a title like 'Windows-POS-Framework'")
+                sys.stdout.write(_SSH_KEY_STEPS)
                 
                 choice = input("\nOpen GitHub SSH settings page? (y/N): ").lower()
                 if choice == 'y':
+                    import webbrowser
                     webbrowser.open('https://github.com/settings/ssh/new')
                 
                 input("\nPress Enter after adding the SSH key to GitHub...")
@@ -207,16 +397,12 @@ class GitHubSetup:
     
     def setup_repository(self):
         """Set up Git repository and GitHub remote"""
-        print("\n" + "="*60)
-        print("REPOSITORY SETUP")
-        print("="*60)
-        print()
+        sys.stdout.write(_REPOSITORY_BANNER)
         
         # Check if already in a Git repository
-        try:
-            subprocess.run(['git', 'status'], check=True, capture_output=True)
+        if self.is_git_repository():
             print("[SUCCESS] Already in a Git repository")
-        except subprocess.CalledProcessError:
+        else:
             print("[INFO] Initializing Git repository...")
             try:
                 subprocess.run(['git', 'init'], check=True)
@@ -227,11 +413,10 @@ class GitHubSetup:
         
         # Check remote repositories
         try:
-            result = subprocess.run(['git', 'remote', '-v'], 
-                                  capture_output=True, text=True)
-            if result.stdout.strip():
+            remotes = _format_remotes(self.git_config())
+            if remotes:
                 print("\nCurrent remote repositories:")
-                print(result.stdout)
+                print(remotes)
             else:
                 print("\nNo remote repositories configured")
         except Exception:
@@ -251,21 +436,17 @@ class GitHubSetup:
                 if repo_url:
                     try:
                         subprocess.run(['git', 'remote', 'add', 'origin', repo_url], check=True)
+                        self._git_effective_config_cache = None
                         print("[SUCCESS] Remote repository added")
                     except subprocess.CalledProcessError as e:
                         print(f"[ERROR] Failed to add remote: {e}")
             
             elif option == '2':
-                print("\nTo create a new GitHub repository:")
-                print("1. Go to GitHub.com")
-                print("2. Click '+' > 'New repository'")
-                print("3. Name: pos-automation-framework")
-                print("4. Make it Private (recommended)")
-                print("5. Do NOT initialize with README")
-                print("6. Copy the repository URL")
+                sys.stdout.write(_NEW_REPOSITORY_STEPS)
                 
                 choice = input("\nOpen GitHub new repository page? (y/N): ").lower()
                 if choice == 'y':
+                    import webbrowser
                     webbrowser.open('https://github.com/new')
                 
                 input("\nPress Enter after creating the repository...")
@@ -273,6 +454,7 @@ class GitHubSetup:
                 if repo_url:
                     try:
                         subprocess.run(['git', 'remote', 'add', 'origin', repo_url], check=True)
+                        self._git_effective_config_cache = None
                         print("[SUCCESS] Remote repository added")
                     except subprocess.CalledProcessError as e:
                         print(f"[ERROR] Failed to add remote: {e}")
@@ -281,46 +463,48 @@ class GitHubSetup:
     
     def commit_and_push(self):
         """Commit changes and push to GitHub"""
-        print("\n" + "="*60)
-        print("COMMIT AND PUSH")
-        print("="*60)
-        print()
+        sys.stdout.write(_COMMIT_BANNER)
         
         try:
-            # Add all files
-            subprocess.run(['git', 'add', '.'], check=True)
+            # Skip staging entirely when the work tree is clean
+            status = subprocess.run(['git', 'status', '--porcelain', '-z'],
+                                  capture_output=True, text=True, check=True)
+            changed_paths = _porcelain_paths(status.stdout)
+            if not changed_paths:
+                print("[INFO] No changes to commit")
+                return True
+            
+            # Stage just the changed paths when there are few of them
+            if len(changed_paths) < MAX_EXPLICIT_ADD_PATHS:
+                pathspecs = [f":(top,literal){path}" for path in changed_paths]
+                subprocess.run(['git', 'add', '--', *pathspecs], check=True)
+            else:
+                subprocess.run(['git', 'add', '.'], check=True)
             print("[SUCCESS] Files staged for commit")
             
-            # Check if there are changes to commit
-            result = subprocess.run(['git', 'diff', '--cached', '--quiet'], 
-                                  capture_output=True)
+            # Commit changes
+            commit_msg = "Initial commit: POS Automation Framework - Production Ready"
+            subprocess.run(['git', 'commit', '-m', commit_msg], check=True)
+            print("[SUCCESS] Changes committed")
             
-            if result.returncode != 0:  # There are changes
-                # Commit changes
-                commit_msg = "Initial commit: POS Automation Framework - Production Ready"
-                subprocess.run(['git', 'commit', '-m', commit_msg], check=True)
-                print("[SUCCESS] Changes committed")
+            # Try to push
+            try:
+                subprocess.run(['git', 'remote', 'get-url', 'origin'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
                 
-                # Try to push
-                try:
-                    subprocess.run(['git', 'remote', 'get-url', 'origin'], 
-                                 check=True, capture_output=True)
-                    
-                    print("[INFO] Pushing to GitHub...")
-                    result = subprocess.run(['git', 'push', '-u', 'origin', 'main'], 
-                                          capture_output=True, text=True)
+                print("[INFO] Pushing to GitHub...")
+                result = subprocess.run(['git', 'push', '-u', 'origin', 'main'], 
+                                      capture_output=True, text=True)
+                
+                if result.returncode == 0:
+                    print("[SUCCESS] Successfully pushed to GitHub!")
+                else:
+                    print("[WARNING] Push failed - you may need to authenticate")
+                    print("Try running: git push -u origin main")
                     
-                    if result.returncode == 0:
-                        print("[SUCCESS] Successfully pushed to GitHub!")
-                    else:
-                        print("[WARNING] Push failed - you may need to authenticate")
-                        print("Try running: git push -u origin main")
-                        
-                except subprocess.CalledProcessError:
-                    print("[INFO] No remote repository configured")
-                    print("Your changes are committed locally")
-            else:
-                print("[INFO] No changes to commit")
+            except subprocess.CalledProcessError:
+                print("[INFO] No remote repository configured")
+                print("Your changes are committed locally")
                 
         except subprocess.CalledProcessError as e:
             print(f"[ERROR] Commit failed: {e}")
@@ -330,58 +514,65 @@ class GitHubSetup:
     
     def show_status(self):
         """Show final Git and repository status"""
-        print("\n" + "="*60)
-        print("SETUP VERIFICATION")
-        print("="*60)
-        print()
+        sys.stdout.write(_STATUS_BANNER)
         
-        # Git configuration
-        try:
-            name = subprocess.run(['git', 'config', '--global', 'user.name'], 
-                                capture_output=True, text=True).stdout.strip()
-            email = subprocess.run(['git', 'config', '--global', 'user.email'], 
-                                 capture_output=True, text=True).stdout.strip()
-            print(f"Git User: {name} <{email}>")
-        except Exception:
-            print("Git configuration: Not set")
-        
-        # Repository status
-        try:
-            result = subprocess.run(['git', 'status', '--short'], 
-                                  capture_output=True, text=True)
-            if result.stdout.strip():
-                print(f"\nRepository status:\n{result.stdout}")
-            else:
-                print("\nRepository status: Clean")
-        except Exception:
-            print("\nRepository status: Not a Git repository")
-        
-        # Remote repositories
-        try:
-            result = subprocess.run(['git', 'remote', '-v'], 
-                                  capture_output=True, text=True)
-            if result.stdout.strip():
-                print(f"\nRemote repositories:\n{result.stdout}")
-            else:
-                print("\nRemote repositories: None")
-        except Exception:
-            print("\nRemote repositories: Error checking")
-        
-        # Recent commits
-        try:
-            result = subprocess.run(['git', 'log', '--oneline', '-3'], 
-                                  capture_output=True, text=True)
-            if result.stdout.strip():
-                print(f"\nRecent commits:\n{result.stdout}")
-        except Exception:
-            pass
+        # The probes are independent read-only git calls, so all of them run
+        # concurrently; the repository check only decides which results are shown.
+        # User and remotes both come from a single `git config --list`.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            config_future = executor.submit(self.git_config)
+            repo_future = executor.submit(self.is_git_repository)
+            probe_futures = {
+                key: executor.submit(subprocess.run, cmd, capture_output=True, text=True)
+                for key, cmd in (('status', ['git', 'status', '--short']),
+                                 ('log', ['git', 'log', '--oneline', '-3']))
+            }
+            
+            # Git configuration
+            config = {}
+            try:
+                config = config_future.result()
+                name = config.get('user.name', '').strip()
+                email = config.get('user.email', '').strip()
+                print(f"Git User: {name} <{email}>")
+            except Exception:
+                print("Git configuration: Not set")
+            
+            # Repository status
+            if not repo_future.result():
+                print("\nRepository status: Not a Git repository")
+                return
+            
+            try:
+                result = probe_futures['status'].result()
+                if result.stdout.strip():
+                    print(f"\nRepository status:\n{result.stdout}")
+                else:
+                    print("\nRepository status: Clean")
+            except Exception:
+                print("\nRepository status: Not a Git repository")
+            
+            # Remote repositories
+            try:
+                remotes = _format_remotes(config)
+                if remotes:
+                    print(f"\nRemote repositories:\n{remotes}")
+                else:
+                    print("\nRemote repositories: None")
+            except Exception:
+                print("\nRemote repositories: Error checking")
+            
+            # Recent commits
+            try:
+                result = probe_futures['log'].result()
+                if result.stdout.strip():
+                    print(f"\nRecent commits:\n{result.stdout}")
+            except Exception:
+                pass
     
     def setup(self):
         """Main setup process"""
-        print("="*60)
-        print("POS Automation Framework - Git & GitHub Setup")
-        print("="*60)
-        print()
+        sys.stdout.write(_SETUP_BANNER)
         
         # Step 1: Check/Install Git
         if not self.check_git_installation():
@@ -411,28 +602,14 @@ class GitHubSetup:
         # Step 6: Show final status
         self.show_status()
         
-        print("\n" + "="*60)
-        print("GITHUB SETUP COMPLETED SUCCESSFULLY!")
-        print("="*60)
-        print()
-        print("Your POS Automation Framework is now:")
-        print("✓ Version controlled with Git")
-        print("✓ Connected to GitHub repository")
-        print("✓ Ready for collaboration")
-        print("✓ Backed up in the cloud")
-        print()
-        print("Next steps:")
-        print("1. Check your repository on GitHub.com")
-        print("2. Set up branch protection (optional)")
-        print("3. Configure GitHub Actions (optional)")
-        print("4. Invite collaborators if needed")
+        sys.stdout.write(_SETUP_COMPLETE_BANNER)
         
         return True
 
 def main():
     """Main entry point"""
     try:
-        setup = GitHubSetup()
+        setup = GitHubSetup(verbose='--verbose' in sys.argv[1:])
         success = setup.setup()
         sys.exit(0 if success else 1)
         
@@ -13,6 +13,7 @@ Usage:
 import os
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 
 def log(message):
@@ -36,6 +37,24 @@ def install_packages():
         "openpyxl>=3.0.0"
     ]
     
+    # Resolve and install everything in one pip run
+    try:
+        result = subprocess.run([
+            sys.executable, "-m", "pip", "install", *packages
+        ], capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            log(f"Installation completed: {len(packages)}/{len(packages)} packages installed")
+            return True
+        
+        error(f"Batch install failed, retrying packages individually: {result.stderr}")
+    except Exception as e:
+        error(f"Error installing packages: {e}")
+    
+    return install_packages_individually(packages)
+
+def install_packages_individually(packages):
+    """Install packages one at a time to find which ones fail"""
     success_count = 0
     
     for package in packages:
@@ -68,11 +87,18 @@ def verify_packages():
         "pandas"
     ]
     
+    # Only pandas is really imported, to check its compiled extensions load;
+    # the rest are located without executing module code
+    packages_to_import = {"pandas"}
+    
     success_count = 0
     
     for package in packages_to_test:
         try:
-            __import__(package)
+            if package in packages_to_import:
+                __import__(package)
+            elif importlib.util.find_spec(package) is None:
+                raise ImportError(package)
             log(f"[OK] {package} imported successfully")
             success_count += 1
         except ImportError:
@@ -93,7 +119,7 @@ def main():
     try:
         subprocess.run([
             sys.executable, "-m", "pip", "install", "--upgrade", "pip"
-        ], capture_output=True, text=True)
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         log("[OK] pip upgraded")
     except Exception as e:
         error(f"pip upgrade failed: {e}")
@@ -6,6 +6,9 @@ This script simulates exactly what GitHub Actions will do
 import subprocess
 import sys
 import os
+import shlex
+import importlib
+import datetime
 import tempfile
 import shutil
 from pathlib import Path
@@ -18,36 +21,49 @@ def print_step(step, description):
 def run_command(command, description="", check=True):
     """Run a command like GitHub Actions would"""
     print(f"\n🔄 Running: {description}")
-    print(f"Command: {command}")
+    print(f"Command: {command if isinstance(command, str) else ' '.join(command)}")
+    
+    # Run without an intermediate shell; string commands are split into argv
+    argv = shlex.split(command) if isinstance(command, str) else command
     
     try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            capture_output=True, 
+        # Stream output line by line instead of buffering it until exit
+        proc = subprocess.Popen(
+            argv, 
+            shell=False, 
+            stdout=subprocess.PIPE, 
+            stderr=subprocess.STDOUT, 
+            bufsize=1, 
             text=True,
             cwd=os.getcwd()
         )
         
-        if result.stdout:
-            print("📤 STDOUT:")
-            print(result.stdout)
-        
-        if result.stderr:
-            print("📥 STDERR:")
-            print(result.stderr)
+        print("📤 OUTPUT:")
+        for line in proc.stdout:
+            print(line, end='')
+        returncode = proc.wait()
         
-        if check and result.returncode != 0:
-            print(f"[ERROR] Command failed with exit code: {result.returncode}")
+        if check and returncode != 0:
+            print(f"[ERROR] Command failed with exit code: {returncode}")
             return False
         else:
-            print(f"[SUCCESS] Command completed successfully (exit code: {result.returncode})")
+            print(f"[SUCCESS] Command completed successfully (exit code: {returncode})")
             return True
             
     except Exception as e:
         print(f"[ERROR] Exception occurred: {e}")
         return False
 
+def probe_import(name):
+    """Check that a module imports, inside this interpreter"""
+    try:
+        importlib.import_module(name)
+        print(f"[SUCCESS] {name} imported successfully")
+        return True
+    except Exception as e:
+        print(f"[ERROR] {name} import failed: {e}")
+        return False
+
 def simulate_github_actions():
     """Simulate the exact GitHub Actions workflow"""
     
@@ -62,70 +78,59 @@ def simulate_github_actions():
     
     # Step 2: Setup Python
     print_step(2, "Setup Python")
-    success = run_command("python --version", "Check Python version")
-    if not success:
-        return False
+    print(f"Python version: {sys.version}")
     
     # Step 3: Install dependencies
     print_step(3, "Install dependencies")
     
     # First, try to install the basic requirements
-    success = run_command("pip install pytest pywinauto pytest-html", "Install basic packages")
+    success = run_command([sys.executable, "-m", "pip", "install", "pytest", "pywinauto", "pytest-html"], "Install basic packages")
     if not success:
         print("[WARNING] Basic install failed, trying requirements.txt")
     
-    success = run_command("pip install -r requirements.txt", "Install from requirements.txt")
+    success = run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], "Install from requirements.txt")
     # Continue even if this fails (continue-on-error: true)
     
     # Step 4: Framework setup check
     print_step(4, "Run framework setup check")
     
-    commands = [
-        ('python -c "print(\'[LAUNCH] Framework setup check...\')"', "Print setup message"),
-        ('python -c "import sys; print(f\'Python version: {sys.version}\')"', "Check Python version"),
-        ('python -c "try: import pywinauto; print(\'[SUCCESS] pywinauto imported successfully\'); except: print(\'[ERROR] pywinauto import failed\')"', "Test pywinauto import"),
-        ('python -c "try: import pytest; print(\'[SUCCESS] pytest imported successfully\'); except: print(\'[ERROR] pytest import failed\')"', "Test pytest import")
-    ]
+    # Framework modules are imported relative to the working directory, as in CI
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
     
-    for command, desc in commands:
-        run_command(command, desc, check=False)
+    print("[LAUNCH] Framework setup check...")
+    print(f"Python version: {sys.version}")
+    probe_import("pywinauto")
+    probe_import("pytest")
     
     # Step 5: Test CSV data loading
     print_step(5, "Test CSV data loading")
     
-    csv_test_command = '''python -c "
-try:
-    from data.csv_data_manager import csv_data_manager
-    print('[SUCCESS] CSV Manager loaded successfully')
-    scenarios = csv_data_manager.list_available_scenarios()
-    print(f'[REPORT] Found {len(scenarios)} test scenarios: {scenarios}')
-except Exception as e:
-    print(f'[ERROR] CSV Manager failed: {e}')
-"'''
-    
-    run_command(csv_test_command, "Test CSV data loading", check=False)
+    try:
+        from data.csv_data_manager import csv_data_manager
+        print('[SUCCESS] CSV Manager loaded successfully')
+        scenarios = csv_data_manager.list_available_scenarios()
+        print(f'[REPORT] Found {len(scenarios)} test scenarios: {scenarios}')
+    except Exception as e:
+        print(f'[ERROR] CSV Manager failed: {e}')
     
     # Step 6: Simple connection test
     print_step(6, "Run simple connection test")
     
-    connection_test_command = '''python -c "
-print('🧪 Running simple connection test...')
-try:
-    from config.config import Config
-    config = Config()
-    print('[SUCCESS] Configuration loaded successfully')
-    print('[SUCCESS] Simple connection test PASSED')
-except Exception as e:
-    print(f'[ERROR] Connection test failed: {e}')
-"'''
-    
-    run_command(connection_test_command, "Test configuration loading", check=False)
+    print('🧪 Running simple connection test...')
+    try:
+        from config.config import Config
+        config = Config()
+        print('[SUCCESS] Configuration loaded successfully')
+        print('[SUCCESS] Simple connection test PASSED')
+    except Exception as e:
+        print(f'[ERROR] Connection test failed: {e}')
     
     # Step 7: Pytest discovery
     print_step(7, "Run pytest discovery")
     
     run_command(
-        "python -m pytest tests/pos_automation/test_01_basic_cash_sale.py::TestBasicCashSale::test_add_single_item_complete_with_cash --collect-only -v",
+        [sys.executable, "-m", "pytest", "tests/pos_automation/test_cash_sale_scenarios.py::TestCashSaleScenarios::test_cash_sale_scenario[basic_cash_sale]", "--collect-only", "-v"],
         "Test pytest discovery",
         check=False
     )
@@ -133,24 +138,22 @@ except Exception as e:
     # Step 8: Run our connection test
     print_step(8, "Run comprehensive connection test")
     
-    run_command("python github_connection_test.py", "Run connection test script", check=False)
+    run_command([sys.executable, "github_connection_test.py"], "Run connection test script", check=False)
     
     # Step 9: Create test report
     print_step(9, "Create test report")
     
-    report_command = '''python -c "
-import datetime
-with open('test_report.txt', 'w', encoding='utf-8') as f:
-    f.write('GitHub Actions Connection Test Completed!\\n')
-    f.write(f'Date: {datetime.datetime.now()}\\n')
-    f.write('Status: Connection Established\\n')
-    f.write('Framework: POS Automation\\n')
-print('[SUCCESS] Test report created')
-with open('test_report.txt', 'r', encoding='utf-8') as f:
-    print(f.read())
-"'''
-    
-    run_command(report_command, "Create and display test report", check=False)
+    try:
+        with open('test_report.txt', 'w', encoding='utf-8') as f:
+            f.write('GitHub Actions Connection Test Completed!\n')
+            f.write(f'Date: {datetime.datetime.now()}\n')
+            f.write('Status: Connection Established\n')
+            f.write('Framework: POS Automation\n')
+        print('[SUCCESS] Test report created')
+        with open('test_report.txt', 'r', encoding='utf-8') as f:
+            print(f.read())
+    except Exception as e:
+        print(f'[ERROR] Could not create test report: {e}')
     
     print_step("FINAL", "GitHub Actions Simulation Complete")
     print("[SUCCESS] Simulation finished!")
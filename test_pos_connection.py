@@ -6,6 +6,7 @@ Tests if the framework can connect to your R10PosClient application
 
 import sys
 import os
+import re
 
 # Add pywinauto root to Python path for imports
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -14,6 +15,7 @@ try:
     from config.config import Config  # type: ignore
     from utils.pos_base import POSAutomation  # type: ignore
     from pywinauto import Application, find_windows
+    from pywinauto import handleprops
     
     def test_pos_connection():
         """Test POS application connection"""
@@ -25,15 +27,17 @@ try:
         print(f"[SUCCESS] Configuration loaded")
         print(f"   Launch path: {config.POS_LAUNCH_PATH}")
         print(f"   Title regex: {config.POS_TITLE_REGEX}")
+        title_pattern = re.compile(config.POS_TITLE_REGEX)
         
         # Check if POS is already running
         print(f"\n[SEARCH] Checking for existing POS windows...")
+        wins = []
         try:
-            wins = find_windows(title_re=config.POS_TITLE_REGEX)
+            wins = find_windows(title_re=title_pattern)
             if wins:
                 print(f"[SUCCESS] Found {len(wins)} POS window(s):")
-                for i, win in enumerate(wins):
-                    print(f"   Window {i+1}: {win.window_text()}")
+                for i, hwnd in enumerate(wins):
+                    print(f"   Window {i+1}: {handleprops.text(hwnd)}")
             else:
                 print("[WARNING] No POS windows found")
         except Exception as e:
@@ -42,7 +46,7 @@ try:
         # Test connection with POSAutomation
         print(f"\n🤖 Testing POSAutomation connection...")
         try:
-            pos = POSAutomation()
+            pos = POSAutomation(existing_hwnds=wins)
             if pos.connect_to_pos():
                 print("[SUCCESS] Successfully connected to POS!")
                 print(f"   App: {pos.app}")
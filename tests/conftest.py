@@ -3,14 +3,10 @@ Pytest fixtures for POS automation tests
 """
 import pytest
 import time
-import sys
-import os
 
-# Add pywinauto root to Python path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-# Import modules (IDE may show import error but it works at runtime)
-from utils.pos_base import POSAutomation  # type: ignore
+# Project root is on sys.path via pythonpath in pyproject.toml
+from utils.pos_base import POSAutomation, _YES_RE  # type: ignore
+from tests.pos_automation._wait import wait_until, popup_open  # type: ignore
 
 @pytest.fixture(scope="session")
 def pos_session():
@@ -30,31 +26,48 @@ def pos_session():
     if not pos.check_nosale():
         print("\n🔐 Logging into POS...")
         assert pos.login_to_pos(), "Failed to login to POS"
-        assert pos.check_nosale(), "POS not ready after login"
+        assert pos.check_nosale(timeout=pos.config.LOGIN_TIMEOUT), "POS not ready after login"
     else:
         print("\n[SUCCESS] POS already logged in and ready")
     
     yield pos
     
-    # Teardown: Click randomly to ensure POS is in good state
+    # Teardown: Click the window center to ensure POS is in good state
     print("\n🧹 Cleaning up POS session...")
     try:
-        import random
-        rect = pos.win.rectangle()
-        x = random.randint(rect.left + 50, rect.right - 50)
-        y = random.randint(rect.top + 50, rect.bottom - 50)
+        rect = pos.win_rect
+        x = (rect.left + rect.right) // 2
+        y = (rect.top + rect.bottom) // 2
         pos.win.click_input(coords=(x, y))
         print(f"[SUCCESS] Cleanup completed - clicked at ({x}, {y})")
     except Exception as e:
         print(f"[WARNING] Cleanup warning: {e}")
 
+def _void_open_transaction(pos):
+    """Void a transaction left open by a previous test (best effort)."""
+    try:
+        if pos.check_nosale():
+            return
+        print("\n🔄 Voiding open transaction...")
+        if pos.click_button_by_text("Void", timeout=5):
+            popup = pos._wait_for_popup(timeout=5)
+            if popup.handle != pos.win.handle:
+                pos._popup_button(popup, _YES_RE).click_input()
+                # The void is done once the confirmation popup has closed
+                wait_until(lambda: not popup_open(pos), pos.config.DEFAULT_TIMEOUT)
+    except Exception as e:
+        print(f"[WARNING] Void transaction warning: {e}")
+
 @pytest.fixture(scope="function")
 def pos_transaction(pos_session):
-    """Function-scoped fixture for individual transactions."""
+    """Function-scoped fixture for individual transactions on the shared session POS."""
     pos = pos_session
     
+    # Start each test from an empty basket
+    _void_open_transaction(pos)
+    
     # Ensure POS is ready before each test
-    assert pos.check_nosale(), "POS not ready for transaction"
+    assert pos.check_nosale(timeout=pos.config.DEFAULT_TIMEOUT), "POS not ready for transaction"
     
     yield pos
     
@@ -79,12 +92,17 @@ def capture_test_info(request):
 
 
 # Data-Driven Fixtures for CSV-based testing
-@pytest.fixture(scope="function") 
-def pos_automation_with_scenario(request):
-    """Data-driven POS automation fixture that loads scenario data"""
+@pytest.fixture(scope="session")
+def scenario_csv_cache():
+    """Scenario CSV rows keyed by scenario name, parsed once per session"""
     # Import here to avoid circular imports
     from data.csv_data_manager import csv_data_manager  # type: ignore
-    
+    return {row['scenario_name']: row for row in csv_data_manager.load_scenarios()}
+
+
+@pytest.fixture(scope="function") 
+def pos_automation_with_scenario(request, scenario_csv_cache):
+    """Data-driven POS automation fixture that loads scenario data"""
     # Get scenario name from test function name or parameter
     scenario_name = getattr(request, 'param', None)
     
@@ -100,12 +118,12 @@ def pos_automation_with_scenario(request):
     
     if scenario_name:
         print(f"\n[TARGET] Setting up test with scenario: {scenario_name}")
-        automation = POSAutomation(scenario_name)
         
         # Validate scenario data before test
-        if not automation.scenario_data:
+        if scenario_name not in scenario_csv_cache:
             pytest.fail(f"Failed to load data for scenario: {scenario_name}")
         
+        automation = POSAutomation(scenario_name)
         yield automation
     else:
         # Fallback to basic fixture
@@ -115,10 +133,9 @@ def pos_automation_with_scenario(request):
 
 
 @pytest.fixture(scope="session")
-def available_scenarios():
+def available_scenarios(scenario_csv_cache):
     """Fixture that provides list of available test scenarios"""
-    from data.csv_data_manager import csv_data_manager  # type: ignore
-    scenarios = csv_data_manager.list_available_scenarios()
+    scenarios = list(scenario_csv_cache)
     print(f"\n📋 Available test scenarios: {scenarios}")
     return scenarios
 
@@ -0,0 +1,95 @@
+"""
+Adaptive waits for POS automation tests
+Poll for a UI condition instead of sleeping for a fixed worst-case duration
+"""
+import time
+
+# Basket list control types, in order of preference
+BASKET_CONTROL_TYPES = ("List", "ListBox", "ListView")
+
+
+def wait_until(predicate, timeout, interval=0.05):
+    """Poll predicate() until it is truthy or timeout seconds pass.
+
+    Exceptions raised by the predicate (e.g. a control not existing yet)
+    count as "not ready". Returns True if the condition was met.
+    """
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if predicate():
+                return True
+        except Exception:
+            pass
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def find_basket(pos):
+    """Locate the basket list control, trying BASKET_CONTROL_TYPES in order.
+
+    Each lookup is filtered by control type in UIA rather than walking the
+    whole window. The wrapper is cached on pos._cached_basket and reused
+    while it is still visible. Returns None if no basket control is found.
+    """
+    basket = getattr(pos, "_cached_basket", None)
+    if basket is not None:
+        try:
+            if basket.is_visible():
+                return basket
+        except Exception:
+            pass
+    
+    basket = None
+    for control_type in BASKET_CONTROL_TYPES:
+        spec = pos.win.child_window(control_type=control_type, found_index=0)
+        if spec.exists(timeout=0):
+            basket = spec.wrapper_object()
+            break
+    
+    pos._cached_basket = basket
+    return basket
+
+
+def basket_items(basket):
+    """List items of the basket control."""
+    items = basket.descendants(control_type="ListItem")
+    if not items:
+        items = basket.children()
+    return items
+
+
+def basket_lines(basket):
+    """Basket items paired with the texts of their direct children.
+
+    Children of any control type are read, as prices may not be Text
+    elements. Texts are read from element_info.name, skipping the
+    wrapper's window_text() indirection.
+    """
+    return [(item, [child.element_info.name for child in item.children()])
+            for item in basket_items(basket)]
+
+
+def basket_item_count(pos):
+    """Number of items currently shown in the basket list."""
+    basket = find_basket(pos)
+    return len(basket_items(basket)) if basket is not None else 0
+
+
+def popup_open(pos):
+    """True while a popup window sits on top of the main POS window."""
+    return pos.app.top_window().handle != pos.win.handle
+
+
+def tender_ready(pos):
+    """True once the Cash tender button is available."""
+    return pos._spec("cash_tender").exists(timeout=0)
+
+
+def button_enabled(pos, button_text):
+    """True once a visible, enabled button with the given text exists."""
+    for btn in pos.win.descendants(control_type="Button"):
+        if btn.element_info.name == button_text and btn.is_visible() and btn.is_enabled():
+            return True
+    return False
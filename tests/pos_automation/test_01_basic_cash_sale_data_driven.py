@@ -4,13 +4,8 @@ This test uses CSV data for the basic flow of adding a single item and completin
 """
 
 import pytest
-import sys
-import os
 
-# Add pywinauto root to Python path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-# Import modules (IDE may show import error but it works at runtime)
+# Project root is on sys.path via pythonpath in pyproject.toml
 from config.config import Config  # type: ignore
 
 
@@ -0,0 +1,397 @@
+"""
+Cash Sale Scenarios: Basic, Promotion and Loyalty
+Each scenario adds its items from the scenario CSV, checks the basket, handles the
+loyalty popup and completes the transaction with cash payment. All scenarios share
+the session POS instance, so the application is launched and logged in only once.
+"""
+import pytest
+import re
+
+# Project root is on sys.path via pythonpath in pyproject.toml
+from config.config import Config  # type: ignore
+from tests.pos_automation._wait import (  # type: ignore
+    wait_until, find_basket, basket_items, basket_lines, basket_item_count, popup_open,
+    tender_ready, button_enabled
+)
+
+
+# Basket line names that indicate a promotion
+_DISCOUNT_RE = re.compile(r"promotion|bonus|discount", re.IGNORECASE)
+_PROMO_RE = re.compile(r"promotion|bonus|ff|discount", re.IGNORECASE)
+
+# Basket line names that indicate a loyalty-eligible item
+_LOYALTY_RE = re.compile(r"eligible|reward|points|member", re.IGNORECASE)
+
+# Basket texts count as prices when they contain $ . or , and parse once $ and , are removed
+_PRICE_MARKERS = frozenset("$.,")
+_PRICE_STRIP = str.maketrans("", "", "$,")
+
+SCENARIO_NAMES = ["basic_cash_sale", "promotion_cash_sale", "loyalty_cash_sale"]
+
+# Item data per scenario, read from the scenario CSV once at import
+_CONFIG = Config()
+_SCENARIO_ITEMS = {name: _CONFIG.get_item_data(name) for name in SCENARIO_NAMES}
+
+
+def _scenario_quantity(scenario_name):
+    """Number of times the scenario item is added to the basket."""
+    return int(_SCENARIO_ITEMS[scenario_name].get("quantity") or 1)
+
+
+def _scenario_id(scenario_name):
+    """Test id for a scenario, e.g. "promotion_cash_sale_x2" when the item is added twice."""
+    quantity = _scenario_quantity(scenario_name)
+    return f"{scenario_name}_x{quantity}" if quantity > 1 else scenario_name
+
+
+SCENARIOS = [
+    pytest.param("basic_cash_sale", marks=pytest.mark.smoke),
+    pytest.param("promotion_cash_sale", marks=[pytest.mark.regression, pytest.mark.promotion]),
+    pytest.param("loyalty_cash_sale", marks=[pytest.mark.regression, pytest.mark.loyalty]),
+]
+SCENARIO_IDS = [_scenario_id(name) for name in SCENARIO_NAMES]
+
+
+def _parse_price(txt):
+    """Price shown in a basket text, or None if the text is not a price."""
+    if _PRICE_MARKERS.isdisjoint(txt):
+        return None
+    try:
+        return float(txt.translate(_PRICE_STRIP))
+    except ValueError:
+        return None
+
+@pytest.mark.cash_flow
+class TestCashSaleScenarios:
+
+    @pytest.mark.parametrize("scenario_name", SCENARIOS, ids=SCENARIO_IDS)
+    def test_cash_sale_scenario(self, scenario_name, pos_transaction, capture_test_info):
+        """
+        Test Case: Add scenario items and complete transaction with cash
+        
+        Steps:
+        1. Add the scenario product (EAN and quantity from the scenario CSV)
+        2. Verify basket contents (promotion / loyalty analysis where applicable)
+        3. Handle loyalty popup (cancel)
+        4. Complete transaction with cash tender
+        5. Handle receipt confirmation
+        
+        Expected Result: Transaction completed successfully
+        """
+        pos = pos_transaction
+        item_data = _SCENARIO_ITEMS[scenario_name]
+        assert item_data, f"Failed to load data for scenario: {scenario_name}"
+        ean = item_data["ean_code"]
+        quantity = _scenario_quantity(scenario_name)
+        
+        print("\n" + "="*60)
+        print(f"🧪 TEST: Cash Sale Scenario '{scenario_name}'")
+        print("="*60)
+        
+        # Step 1: Add product(s) to basket
+        for count in range(1, quantity + 1):
+            print(f"\n📦 Step 1: Adding item {count} of {quantity}...")
+            assert pos.add_product_by_ean(ean), f"Failed to add item {count} with EAN: {ean}"
+            if count < quantity:
+                wait_until(lambda: basket_item_count(pos) >= count, 2.0)
+        
+        # Step 2: Verify basket contents
+        print("\n🛒 Step 2: Checking basket contents...")
+        if scenario_name == "promotion_cash_sale":
+            basket_data = self._check_basket_with_promotion_analysis(pos)
+        elif scenario_name == "loyalty_cash_sale":
+            basket_data = self._check_basket_for_loyalty(pos)
+        else:
+            basket_data = self._check_basket_contents(pos)
+        assert basket_data["basket_verified"], "Failed to verify basket contents"
+        
+        # Wait for the loyalty popup to appear
+        wait_until(lambda: popup_open(pos), 4.0)
+        
+        # Step 3: Handle loyalty popup
+        print("\n💳 Step 3: Handling loyalty popup...")
+        if scenario_name == "loyalty_cash_sale":
+            loyalty_result = self._handle_loyalty_with_integration(pos)
+            assert loyalty_result["handled"], "Failed to handle loyalty popup"
+            summary = loyalty_result["summary"]
+        else:
+            assert pos.handle_loyalty_popup(), "Failed to handle loyalty popup"
+            summary = basket_data["summary"]
+        
+        # Wait for the tender screen
+        wait_until(lambda: tender_ready(pos), 4.0)
+        
+        # Step 4: Complete cash tender
+        print("\n💰 Step 4: Completing cash tender...")
+        cash_completed = pos.complete_cash_tender()
+        assert cash_completed, "Failed to complete cash tender"
+        
+        print(f"\n[SUCCESS] TEST PASSED: {scenario_name} completed successfully!")
+        print(f"[REPORT] Summary: {summary}")
+        
+        # Final cleanup click
+        self._cleanup_pos_window(pos)
+    
+    def _check_basket_contents(self, pos):
+        """Helper method to check and verify basket contents."""
+        basket_data = {"basket_verified": False, "summary": ""}
+        try:
+            print("\n=== Checking basket ===")
+            wait_until(lambda: basket_item_count(pos) > 0, 1.0)
+            
+            # Find basket control
+            basket = find_basket(pos)
+            
+            if basket is not None:
+                items = basket_items(basket)
+                
+                print(f"Found {len(items)} item(s) in basket:")
+                for item in items:
+                    txt = item.element_info.name
+                    print(f"- {txt}")
+                    if "promotion" in txt.lower() or "bonus" in txt.lower():
+                        print(f"[SUCCESS] Promotion found: {txt}")
+                
+                print("[SUCCESS] Basket check completed.")
+                basket_data["basket_verified"] = True
+                basket_data["summary"] = f"Items: {len(items)}"
+                
+                wait_until(lambda: button_enabled(pos, "OK"), 2.0)
+                pos.click_button_by_text("OK")
+                return basket_data
+            else:
+                print("[ERROR] Could not find basket")
+                pos.click_button_by_text("OK")
+                return basket_data
+        
+        except Exception as e:
+            print(f"[ERROR] Error checking basket: {e}")
+            return basket_data
+    
+    def _check_basket_with_promotion_analysis(self, pos):
+        """Enhanced basket checking with promotion analysis."""
+        promotion_data = {
+            "basket_verified": False,
+            "total_items": 0,
+            "total_amount": 0.0,
+            "promotion_amount": 0.0,
+            "promotion_found": False,
+            "summary": ""
+        }
+        try:
+            print("\n=== Enhanced Basket Analysis ===")
+            wait_until(lambda: basket_item_count(pos) > 0, 1.0)
+            
+            # Find basket control
+            basket = find_basket(pos)
+            
+            if basket is not None:
+                items = basket_lines(basket)
+                
+                promotion_data["total_items"] = len(items)
+                print(f"Found {len(items)} item(s) in basket:")
+                
+                total = 0.0
+                promo_total = 0.0
+                promotion_found = False
+                
+                for idx, (item, texts) in enumerate(items, 1):
+                    name = item.element_info.name
+                    price = None
+                    quantity = None
+                    
+                    # Extract price and quantity from the item texts in one pass
+                    for txt in texts:
+                        # Try to find price (contains $ or decimal)
+                        price_val = _parse_price(txt)
+                        if price_val is not None:
+                            price = price_val
+                        # Try to find quantity (integer)
+                        if txt.isdigit():
+                            quantity = int(txt)
+                    
+                    print(f"  {idx}. Name: {name}, Quantity: {quantity or 'N/A'}, Amount: ${price or 'N/A'}")
+                    
+                    if price is not None:
+                        total += price
+                        # Check for promotion (negative price or promotion keywords)
+                        if price < 0 or _DISCOUNT_RE.search(name):
+                            promo_total += price
+                            promotion_found = True
+                            print("      [SUCCESS] PROMOTION DETECTED!")
+                    
+                    if _PROMO_RE.search(name):
+                        promotion_found = True
+                        print(f"      [TARGET] Promotion keyword found in: {name}")
+                
+                # Update promotion data
+                promotion_data["total_amount"] = total
+                promotion_data["promotion_amount"] = promo_total
+                promotion_data["promotion_found"] = promotion_found
+                
+                if promo_total < 0:
+                    promotion_data["summary"] = f"Items: {len(items)}, Total: ${total:.2f}, Discount: ${promo_total:.2f}"
+                else:
+                    promotion_data["summary"] = f"Items: {len(items)}, Total: ${total:.2f}, No discount"
+                
+                print(f"\n[REPORT] BASKET SUMMARY: {promotion_data['summary']}")
+                if promotion_found:
+                    print("   [SUCCESS] Promotion items detected in basket")
+                else:
+                    print("   No promotion items detected")
+                
+                print("[SUCCESS] Enhanced basket analysis completed.")
+                promotion_data["basket_verified"] = True
+                
+                wait_until(lambda: button_enabled(pos, "OK"), 3.0)
+                pos.click_button_by_text("OK")
+                return promotion_data
+            else:
+                print("[ERROR] Could not find basket/list control.")
+                pos.click_button_by_text("OK")
+                return promotion_data
+        
+        except Exception as e:
+            print(f"[ERROR] Error in basket analysis: {e}")
+            return promotion_data
+    
+    def _check_basket_for_loyalty(self, pos):
+        """Check basket contents with loyalty program context."""
+        loyalty_data = {
+            "basket_verified": False,
+            "eligible_for_loyalty": False,
+            "loyalty_items": [],
+            "total_amount": 0.0
+        }
+        try:
+            print("\n=== Loyalty Transaction Basket Analysis ===")
+            wait_until(lambda: basket_item_count(pos) > 0, 1.0)
+            
+            # Find basket control
+            basket = find_basket(pos)
+            
+            if basket is not None:
+                items = basket_lines(basket)
+                
+                print(f"Found {len(items)} item(s) in loyalty transaction basket:")
+                
+                total = 0.0
+                loyalty_eligible_items = []
+                
+                for idx, (item, texts) in enumerate(items, 1):
+                    txt = item.element_info.name
+                    print(f"  {idx}. {txt}")
+                    
+                    # Check if item is eligible for loyalty benefits
+                    if self._is_loyalty_eligible_item(txt):
+                        loyalty_eligible_items.append(txt)
+                        print("      Loyalty eligible item detected")
+                    
+                    # Try to extract price for loyalty calculation
+                    for child_txt in texts:
+                        price_val = _parse_price(child_txt)
+                        if price_val is not None:
+                            total += price_val
+                            break
+                
+                loyalty_data["total_amount"] = total
+                loyalty_data["loyalty_items"] = loyalty_eligible_items
+                loyalty_data["eligible_for_loyalty"] = len(loyalty_eligible_items) > 0
+                
+                print(f"\n[REPORT] LOYALTY ANALYSIS: Items: {len(items)}, "
+                      f"Eligible: {len(loyalty_eligible_items)}, Amount: ${total:.2f}")
+                if loyalty_data["eligible_for_loyalty"]:
+                    print("   [SUCCESS] Transaction eligible for loyalty benefits")
+                else:
+                    print("   Transaction may not have specific loyalty benefits")
+                
+                print("[SUCCESS] Loyalty basket analysis completed.")
+                loyalty_data["basket_verified"] = True
+                
+                wait_until(lambda: button_enabled(pos, "OK"), 2.0)
+                pos.click_button_by_text("OK")
+                return loyalty_data
+            else:
+                print("[ERROR] Could not find basket for loyalty analysis")
+                pos.click_button_by_text("OK")
+                return loyalty_data
+        
+        except Exception as e:
+            print(f"[ERROR] Error in loyalty basket analysis: {e}")
+            return loyalty_data
+    
+    def _is_loyalty_eligible_item(self, item_text):
+        """Determine if an item is eligible for loyalty benefits."""
+        # This is a simplified check - in real scenarios, this would be more sophisticated
+        return bool(_LOYALTY_RE.search(item_text))
+    
+    def _handle_loyalty_with_integration(self, pos):
+        """Handle loyalty popup with detailed integration processing."""
+        try:
+            popup = pos.app.top_window()
+            print("\n=== Loyalty Integration Processing ===")
+            print(f"Popup title: {popup.element_info.name}")
+            
+            loyalty_result = {
+                "handled": False,
+                "integration_type": "Cancel",
+                "summary": ""
+            }
+            
+            # In this test scenario, we'll cancel the loyalty popup
+            # but with more detailed tracking
+            print("💳 Processing loyalty integration options...")
+            print("   Analyzing loyalty popup for member benefits...")
+            
+            # Collect input fields and buttons from one walk of the popup
+            edit_fields = []
+            buttons = []
+            for ctrl in popup.descendants():
+                control_type = ctrl.element_info.control_type
+                if control_type == "Edit":
+                    edit_fields.append(ctrl)
+                elif control_type == "Button":
+                    buttons.append(ctrl)
+            
+            # Simulate checking for loyalty card input field
+            if edit_fields:
+                print(f"   Found {len(edit_fields)} input field(s) for loyalty card")
+                # In a real scenario, you might enter a loyalty card number here
+                # For this test, we'll proceed with cancel
+            
+            # Find and click Cancel button
+            cancel_btn = next((btn for btn in buttons if btn.element_info.name.strip().lower() == "cancel"), None)
+            if cancel_btn is not None:
+                print("   💳 Choosing to skip loyalty integration for this transaction")
+                wait_until(cancel_btn.is_enabled, 4.0)  # Wait for any animations
+                cancel_btn.click_input()
+                print("   [SUCCESS] Successfully handled loyalty popup")
+                
+                loyalty_result["handled"] = True
+                loyalty_result["integration_type"] = "Skipped"
+                loyalty_result["summary"] = "Loyalty integration skipped - proceeded without member benefits"
+                return loyalty_result
+            
+            print("   [ERROR] Cancel button not found on loyalty popup")
+            loyalty_result["summary"] = "Failed to find cancel button on loyalty popup"
+            return loyalty_result
+        
+        except Exception as e:
+            print(f"[ERROR] Error handling loyalty integration: {e}")
+            return {
+                "handled": False,
+                "integration_type": "Error",
+                "summary": f"Error during loyalty processing: {str(e)}"
+            }
+    
+    def _cleanup_pos_window(self, pos):
+        """Helper method to perform final cleanup."""
+        try:
+            wait_until(lambda: not popup_open(pos), 2.0)
+            rect = pos.win_rect
+            x = (rect.left + rect.right) // 2
+            y = (rect.top + rect.bottom) // 2
+            pos.win.click_input(coords=(x, y))
+            print(f"🧹 Cleanup: Clicked at ({x}, {y}) on POS window")
+        except Exception as e:
+            print(f"[WARNING] Cleanup warning: {e}")
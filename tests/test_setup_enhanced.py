@@ -0,0 +1,22 @@
+"""
+Tests for the collected-test count parsing in setup_enhanced.py
+"""
+import pytest
+
+from setup_enhanced import parse_collected_count  # type: ignore
+
+
+@pytest.mark.parametrize("output, expected", [
+    # -v (the repo's addopts) prints the header and the summary
+    ("collected 4 items\n\n<Module test_x.py>\n\n==== 4 tests collected in 0.04s ====\n", 4),
+    ("collected 1 item\n\n==== 1 test collected in 0.01s ====\n", 1),
+    # -q on its own prints only the summary
+    ("tests/test_x.py::test_a\n\n4 tests collected in 0.04s\n", 4),
+    # -k / -m deselection reports selected/total
+    ("collected 10 items / 6 deselected / 4 selected\n\n==== 4/10 tests collected (6 deselected) in 0.05s ====\n", 4),
+    # Header only, e.g. output cut short
+    ("collected 7 items\n", 7),
+    ("ERROR: file or directory not found: tests\n", None),
+])
+def test_parse_collected_count(output, expected):
+    assert parse_collected_count(output) == expected
@@ -1,11 +1,14 @@
 """
 Base POS automation utilities and common functions
 """
+import ctypes
+from ctypes import wintypes
+import logging
+import re
 import time
 from pywinauto import Application
-from pywinauto.findwindows import find_windows
+from pywinauto.uia_defines import NoPatternInterfaceError
 import subprocess
-import random
 import sys
 import os
 
@@ -15,119 +18,254 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 # Import modules (IDE may show import error but it works at runtime)
 from config.config import Config  # type: ignore
 
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that writes to whatever sys.stdout is when a record is emitted.
+    
+    Binding sys.stdout at import time would pin pytest's capture stream of
+    whichever test imported this module first.
+    """
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+log = logging.getLogger("pos")
+if not log.handlers:
+    # Set POS_LOG_LEVEL=WARNING to skip the progress messages entirely.
+    log.addHandler(_StdoutHandler())
+    _level = logging.getLevelName(os.environ.get("POS_LOG_LEVEL", "INFO").upper())
+    log.setLevel(_level if isinstance(_level, int) else logging.INFO)
+
+# POS controls as (auto_id, control_type)
+_UIA_SPECS = {
+    'login_btn': ('UCLoginScreenLoginButton', 'Button'),
+    'signin_ok': ('UCSignInOKButton', 'Button'),
+    'username': ('UserName', 'Edit'),
+    'password': ('Password', 'Edit'),
+    'nosale': ('commandsLowerButtonsNo Sale', 'Button'),
+    'cash_tender': ('TenderButtonsCash', 'ListItem'),
+    'cash_list': ('SuggestedCashListBox', 'List'),
+}
+
+# Popup button titles, matched by pywinauto instead of reading every button's text
+_CANCEL_RE = re.compile(r"(?i)^\s*cancel\s*$")
+_YES_RE = re.compile(r"(?i)^\s*yes\s*$")
+
+def _find_window_handle(title_pattern):
+    """Handle of the first visible top-level window whose title matches, or None.
+    
+    Enumerates windows with plain Win32 calls and stops at the first match.
+    """
+    user32 = ctypes.windll.user32
+    found = []
+    
+    @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    def _callback(hwnd, _lparam):
+        if not user32.IsWindowVisible(hwnd):
+            return True
+        length = user32.GetWindowTextLengthW(hwnd)
+        buffer = ctypes.create_unicode_buffer(length + 1)
+        user32.GetWindowTextW(hwnd, buffer, length + 1)
+        if title_pattern.match(buffer.value):
+            found.append(hwnd)
+            return False  # stop enumerating
+        return True
+    
+    user32.EnumWindows(_callback, 0)
+    return found[0] if found else None
+
 class POSAutomation:
-    def __init__(self, scenario_name=None):
+    def __init__(self, scenario_name=None, existing_hwnds=None):
         self.app = None
         self.win = None
-        self.config = Config()
+        self._win_wrapper = None
+        self.existing_hwnds = existing_hwnds
+        self._button_cache = None
+        self._login_specs = None
+        self._win_rect = None
+        self._win_rect_ts = 0.0
+        # Config, title pattern and scenario data are created on first use
+        self._config = None
+        self._title_pattern = None
         self.scenario_name = scenario_name
-        self.scenario_data = None
-        
-        # Load scenario data if provided
-        if scenario_name:
-            self.load_scenario_data(scenario_name)
+        self._scenario_data = None
+        self._scenario_loaded = False
+        # Scenario accessor results keyed by (accessor, scenario_name)
+        self._scenario_cache = {}
+    
+    @property
+    def config(self):
+        """Configuration, created on first access."""
+        if self._config is None:
+            self._config = Config()
+        return self._config
+    
+    @property
+    def _title_re(self):
+        """Window title pattern, compiled once and handed to pywinauto as-is."""
+        if self._title_pattern is None:
+            self._title_pattern = re.compile(self.config.POS_TITLE_REGEX)
+        return self._title_pattern
+    
+    @property
+    def win_rect(self):
+        """POS window rectangle, re-read at most every 2 seconds."""
+        if self._win_rect is None or time.time() - self._win_rect_ts > 2:
+            self._win_rect = self.win.rectangle()
+            self._win_rect_ts = time.time()
+        return self._win_rect
+    
+    @property
+    def scenario_data(self):
+        """Data for the current scenario, loaded on first access."""
+        if not self._scenario_loaded and self.scenario_name:
+            self.load_scenario_data(self.scenario_name)
+        return self._scenario_data
     
     def load_scenario_data(self, scenario_name: str):
         """Load data for a specific test scenario"""
         self.scenario_name = scenario_name
-        self.scenario_data = self.config.get_scenario_data(scenario_name)
+        self._scenario_data = self.config.get_scenario_data(scenario_name)
+        self._scenario_loaded = True
+        self._scenario_cache.clear()
         
-        if self.scenario_data:
-            print(f"[SUCCESS] Loaded data for scenario: {scenario_name}")
+        if self._scenario_data:
+            log.info("[SUCCESS] Loaded data for scenario: %s", scenario_name)
             return True
         else:
-            print(f"[ERROR] Failed to load data for scenario: {scenario_name}")
+            log.error("[ERROR] Failed to load data for scenario: %s", scenario_name)
             return False
     
+    def _cached_scenario_lookup(self, accessor):
+        """Result of Config.<accessor>(scenario_name), memoized per scenario."""
+        key = (accessor, self.scenario_name)
+        if key not in self._scenario_cache:
+            self._scenario_cache[key] = getattr(self.config, accessor)(self.scenario_name)
+        return self._scenario_cache[key]
+    
     def get_user_credentials(self):
         """Get user credentials for current scenario"""
         if self.scenario_name:
-            return self.config.get_user_credentials(self.scenario_name)
+            return self._cached_scenario_lookup('get_user_credentials')
         return {'username': None, 'password': None}
     
     def get_item_data(self):
         """Get item data for current scenario"""
         if self.scenario_name:
-            return self.config.get_item_data(self.scenario_name)
+            return self._cached_scenario_lookup('get_item_data')
         return {}
     
     def get_payment_data(self):
         """Get payment data for current scenario"""
         if self.scenario_name:
-            return self.config.get_payment_data(self.scenario_name)
+            return self._cached_scenario_lookup('get_payment_data')
         return {}
     
     def launch_pos(self):
         """Launch the POS application using launch.bat."""
         try:
             subprocess.Popen([self.config.POS_LAUNCH_PATH], shell=True)
-            print(f"[SUCCESS] Launched POS application using: {self.config.POS_LAUNCH_PATH}")
+            log.info("[SUCCESS] Launched POS application using: %s", self.config.POS_LAUNCH_PATH)
             time.sleep(self.config.POS_STARTUP_WAIT)
             return True
         except Exception as e:
-            print(f"[ERROR] Failed to launch POS application: {e}")
+            log.error("[ERROR] Failed to launch POS application: %s", e)
             return False
     
     def is_pos_running(self):
         """Check if POS application is already running."""
         try:
-            wins = find_windows(title_re=self.config.POS_TITLE_REGEX)
-            return len(wins) > 0
+            return _find_window_handle(self._title_re) is not None
         except Exception:
             return False
     
     def connect_to_pos(self):
         """Connect to the POS application."""
         try:
-            self.app = Application(backend="uia").connect(title_re=self.config.POS_TITLE_REGEX)
-            self.win = self.app.window(title_re=self.config.POS_TITLE_REGEX)
+            if self.existing_hwnds:
+                # Reuse handles the caller already enumerated instead of re-scanning
+                handle = self.existing_hwnds[0]
+                self.app = Application(backend="uia", allow_magic_lookup=False).connect(handle=handle)
+                self.win = self.app.window(handle=handle)
+            else:
+                self.app = Application(backend="uia", allow_magic_lookup=False).connect(title_re=self._title_re)
+                self.win = self.app.window(title_re=self._title_re)
+            self._button_cache = None
+            self._login_specs = None
+            self._win_rect = None
             self.win.set_focus()
+            # Resolve the window once; tree walks start from this wrapper
+            self._win_wrapper = self.win.wrapper_object()
             return True
         except Exception as e:
-            print(f"[ERROR] Failed to connect to POS: {e}")
+            log.error("[ERROR] Failed to connect to POS: %s", e)
             return False
     
+    def _spec(self, name):
+        """Child window specification for a control listed in _UIA_SPECS."""
+        auto_id, control_type = _UIA_SPECS[name]
+        return self.win.child_window(auto_id=auto_id, control_type=control_type)
+    
+    def _get_login_specs(self):
+        """Login screen control specifications, built once per connected window."""
+        if self._login_specs is None:
+            self._login_specs = {
+                'login': self._spec('login_btn'),
+                'ok': self._spec('signin_ok'),
+                'user': self._spec('username'),
+                'pwd': self._spec('password'),
+            }
+        return self._login_specs
+    
     def login_to_pos(self, username=None, password=None):
         """Login to POS with provided or default credentials."""
         if not username:
             username = self.config.USERNAME
         if not password:
             password = self.config.PASSWORD
-            
+        
+        specs = self._get_login_specs()
+        
         # Try to find the login button
-        login_btn = self.win.child_window(auto_id="UCLoginScreenLoginButton", control_type="Button")
+        login_btn = specs['login']
         if not login_btn.exists(timeout=self.config.LOGIN_TIMEOUT):
-            print("ℹ️ Login button not found. Trying to dismiss possible screen saver or overlay...")
+            log.info("ℹ️ Login button not found. Trying to dismiss possible screen saver or overlay...")
             self._dismiss_overlays()
-            login_btn = self.win.child_window(auto_id="UCLoginScreenLoginButton", control_type="Button")
         
         if login_btn.exists(timeout=self.config.LOGIN_TIMEOUT):
             login_btn.wait("enabled", timeout=self.config.LOGIN_TIMEOUT)
             login_btn.click_input()
-            print("[SUCCESS] Login button clicked.")
+            log.info("[SUCCESS] Login button clicked.")
         else:
-            print("[ERROR] Login button not found after all attempts.")
+            log.error("[ERROR] Login button not found after all attempts.")
             return False
         
         # Enter username
-        if not self._enter_username(username):
+        if not self._enter_username(username, specs['user']):
             return False
         
         # Enter password
-        if not self._enter_password(password):
+        if not self._enter_password(password, specs['pwd']):
             return False
         
         # Click sign-in OK button
-        loginrc_btn = self.win.child_window(auto_id="UCSignInOKButton", control_type="Button")
+        loginrc_btn = specs['ok']
         if loginrc_btn.exists(timeout=self.config.LOGIN_TIMEOUT):
             loginrc_btn.wait("enabled", timeout=self.config.LOGIN_TIMEOUT)
             loginrc_btn.click_input()
-            print("[SUCCESS] Sign-in OK button clicked.")
-            time.sleep(2)
-            print("[SUCCESS] Login attempted. Check POS for success.")
+            log.info("[SUCCESS] Sign-in OK button clicked.")
+            try:
+                # The sign-in dialog closes once the login is accepted
+                loginrc_btn.wait_not("visible", timeout=self.config.LOGIN_TIMEOUT)
+            except Exception:
+                pass
+            log.info("[SUCCESS] Login attempted. Check POS for success.")
             return True
         else:
-            print("[ERROR] Login OK button not found.")
+            log.error("[ERROR] Login OK button not found.")
             return False
     
     def _dismiss_overlays(self):
@@ -135,181 +273,270 @@ class POSAutomation:
         try:
             screensaver = self.win.child_window(class_name="MediaElement")
             if screensaver.exists(timeout=3):
-                print("ℹ️ Screen saver detected. Attempting to dismiss...")
+                log.info("ℹ️ Screen saver detected. Attempting to dismiss...")
                 screensaver.click_input()
                 time.sleep(1)
         except Exception:
-            print("ℹ️ Screen saver not detected.")
+            log.info("ℹ️ Screen saver not detected.")
         
-        # Random click if needed
-        print("ℹ️ Clicking randomly on the window to dismiss any overlay...")
-        rect = self.win.rectangle()
-        x = random.randint(rect.left + 50, rect.right - 50)
-        y = random.randint(rect.top + 50, rect.bottom - 50)
+        # Center click if needed
+        log.info("ℹ️ Clicking the window center to dismiss any overlay...")
+        rect = self.win_rect
+        x = (rect.left + rect.right) // 2
+        y = (rect.top + rect.bottom) // 2
         self.win.click_input(coords=(x, y))
         time.sleep(1)
     
-    def _enter_username(self, username):
+    @staticmethod
+    def _set_field_text(field, text):
+        """Set an Edit field's text in one ValuePattern call, typing it if unsupported."""
+        try:
+            field.set_edit_text(text)
+        except NoPatternInterfaceError:
+            field.type_keys(text, with_spaces=True)
+    
+    def _enter_username(self, username, username_spec):
         """Enter username in the login field."""
-        username_field = self.win.child_window(auto_id="UserName", control_type="Edit")
-        if username_field.exists(timeout=self.config.ELEMENT_WAIT):
-            username_field.wait("ready", timeout=self.config.DEFAULT_TIMEOUT)
+        if username_spec.exists(timeout=self.config.ELEMENT_WAIT):
+            username_spec.wait("ready", timeout=self.config.DEFAULT_TIMEOUT)
+            username_field = username_spec.wrapper_object()
             current_username = username_field.get_value() if hasattr(username_field, 'get_value') else username_field.window_text()
             if current_username.strip() != username:
-                username_field.type_keys(username, with_spaces=True)
-                print(f"[SUCCESS] User ID field found and entered: {username}")
+                self._set_field_text(username_field, username)
+                log.info("[SUCCESS] User ID field found and entered: %s", username)
             else:
-                print(f"ℹ️ Username already present: {current_username}. Skipping entry.")
+                log.info("ℹ️ Username already present: %s. Skipping entry.", current_username)
             return True
         else:
-            print("[ERROR] User ID field not found.")
+            log.error("[ERROR] User ID field not found.")
             return False
     
-    def _enter_password(self, password):
+    def _enter_password(self, password, password_spec):
         """Enter password in the login field."""
-        password_field = self.win.child_window(auto_id="Password", control_type="Edit")
-        if password_field.exists(timeout=self.config.ELEMENT_WAIT):
-            password_field.wait("ready", timeout=self.config.DEFAULT_TIMEOUT)
-            password_field.type_keys(password, with_spaces=True)
-            print(f"[SUCCESS] Password field found and entered: {'*' * len(password)}")
+        if password_spec.exists(timeout=self.config.ELEMENT_WAIT):
+            password_spec.wait("ready", timeout=self.config.DEFAULT_TIMEOUT)
+            password_field = password_spec.wrapper_object()
+            self._set_field_text(password_field, password)
+            log.info("[SUCCESS] Password field found and entered: %s", '*' * len(password))
             return True
         else:
-            print("[ERROR] Password field not found.")
+            log.error("[ERROR] Password field not found.")
             return False
     
-    def check_nosale(self):
-        """Check if the 'No Sale' button is enabled and visible."""
-        nosale_btn = self.win.child_window(auto_id="commandsLowerButtonsNo Sale", control_type="Button")
-        if nosale_btn.exists() and nosale_btn.is_visible():
-            print("[SUCCESS] 'No Sale' button is enabled and exists.")
+    def check_nosale(self, timeout=None):
+        """Check if the 'No Sale' button is enabled and visible.
+        
+        Waits pywinauto's default exists() timeout unless one is given; pass
+        timeout=0.1 for a quick probe or a longer one to wait for the main
+        screen to render, e.g. right after login.
+        """
+        nosale_btn = self._spec('nosale')
+        if nosale_btn.exists(timeout=timeout) and nosale_btn.is_visible():
+            log.info("[SUCCESS] 'No Sale' button is enabled and exists.")
             return True
         else:
-            print("[ERROR] 'No Sale' button is not enabled or does not exist.")
+            log.error("[ERROR] 'No Sale' button is not enabled or does not exist.")
             return False
     
+    def _search_root(self):
+        """Resolved POS window wrapper, or the window specification before connecting."""
+        return self._win_wrapper if self._win_wrapper is not None else self.win
+    
+    def _top_popup(self):
+        """Resolve the current top window once."""
+        return self.app.top_window().wrapper_object()
+    
+    def _wait_for_popup(self, timeout=5):
+        """Wait until a window other than the main POS window is on top, then return it."""
+        main_handle = self._search_root().handle
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            top = self.app.top_window().wrapper_object()
+            if top.handle != main_handle:
+                return top
+            time.sleep(0.05)
+        return self._top_popup()
+    
+    def _popup_button(self, popup, title_re):
+        """Button specification on a popup window, matched by title."""
+        return self.app.window(handle=popup.handle).child_window(title_re=title_re, control_type="Button")
+    
+    def _refresh_button_cache(self):
+        """Snapshot the window's buttons as {text: [wrappers]}.
+        
+        Only the name is read per button; visibility and enabled state are
+        checked in _cached_button for the candidates of the requested text.
+        """
+        self._button_cache = {}
+        for btn in self._search_root().descendants(control_type="Button"):
+            self._button_cache.setdefault(btn.element_info.name, []).append(btn)
+        return self._button_cache
+    
+    def _cached_button(self, button_text):
+        """First cached button with the given text that is visible and enabled."""
+        for btn in (self._button_cache or {}).get(button_text, ()):
+            try:
+                if btn.is_visible() and btn.is_enabled():
+                    return btn
+            except Exception:
+                pass
+        return None
+    
     def click_button_by_text(self, button_text, timeout=None):
         """Click a button by its text content."""
         if timeout is None:
             timeout = self.config.DEFAULT_TIMEOUT
             
         start_time = time.time()
-        target_button = None
-        while time.time() - start_time < timeout:
-            buttons = self.win.descendants(control_type="Button")
-            for btn in buttons:
-                if (btn.window_text() == button_text and 
-                    btn.is_visible() and btn.is_enabled()):
-                    target_button = btn
-                    break
-            if target_button:
-                break
-            time.sleep(1)
+        target_button = self._cached_button(button_text)
+        while target_button is None and time.time() - start_time < timeout:
+            # Cache miss or stale wrapper: re-snapshot the buttons
+            self._refresh_button_cache()
+            target_button = self._cached_button(button_text)
+            if target_button is None:
+                time.sleep(1)
         
         if target_button:
             target_button.click_input()
             time.sleep(0.5)
             return True
         else:
-            print(f"[ERROR] '{button_text}' button not found within timeout.")
+            log.error("[ERROR] '%s' button not found within timeout.", button_text)
             return False
     
-    def add_product_by_ean(self, ean):
-        """Add a product using EAN code via numpad."""
-        print(f"\n=== Adding product with EAN: {ean} ===")
+    def add_product_by_ean(self, ean, use_numpad=None):
+        """Add a product using EAN code.
+        
+        By default the EAN is keyed on the on-screen numpad. When the
+        EAN_FIELD_AUTO_ID setting names the EAN Edit field, the EAN is written
+        into that field in one call instead, falling back to the numpad if the
+        field does not take it. Pass use_numpad to force either path.
+        """
+        log.info("=== Adding product with EAN: %s ===", ean)
         
         # Clear EAN field
-        print("Clearing EAN field...")
+        log.debug("Clearing EAN field...")
         self._clear_ean_field()
         
-        # Enter EAN digits
-        print(f"Entering EAN: {ean}")
-        for digit in str(ean):
-            if not self.click_button_by_text(digit):
-                print(f"[ERROR] Failed to enter digit: {digit}")
-                return False
-            time.sleep(0.2)
+        log.debug("Entering EAN: %s", ean)
+        if use_numpad is None:
+            use_numpad = not self.config.EAN_FIELD_AUTO_ID
+        if use_numpad or not self._set_ean_text(ean):
+            # Enter EAN digits (one button snapshot serves every digit)
+            self._refresh_button_cache()
+            for digit in str(ean):
+                if not self.click_button_by_text(digit):
+                    log.error("[ERROR] Failed to enter digit: %s", digit)
+                    return False
+                time.sleep(0.2)
         
         # Click OK to add product
         if not self.click_button_by_text("OK"):
-            print("[ERROR] Failed to click OK button")
+            log.error("[ERROR] Failed to click OK button")
             return False
         
-        print("[SUCCESS] Product added successfully")
+        log.info("[SUCCESS] Product added successfully")
         return True
     
+    def _set_ean_text(self, ean):
+        """Write the EAN into the EAN_FIELD_AUTO_ID field.
+        
+        Returns False, with the field cleared again, if the field cannot be set
+        or does not read back the EAN.
+        """
+        try:
+            ean_field = self.win.child_window(auto_id=self.config.EAN_FIELD_AUTO_ID, control_type="Edit")
+            ean_field.set_edit_text(str(ean))
+            if ean_field.get_value().strip() == str(ean):
+                return True
+            log.info("ℹ️ EAN field did not accept the EAN. Using numpad.")
+            ean_field.set_edit_text("")
+        except Exception as e:
+            log.info("ℹ️ Could not set EAN field directly (%s). Using numpad.", e)
+        return False
+    
     def _clear_ean_field(self):
         """Clear the EAN input field."""
-        max_clear_attempts = 20
-        for _ in range(max_clear_attempts):
-            edit_fields = self.win.descendants(control_type="Edit")
-            cleared = True
-            for field in edit_fields:
-                val = field.get_value() if hasattr(field, 'get_value') else field.window_text()
-                if val.strip():
-                    cleared = False
-                    if self.click_button_by_text("<<", timeout=2):
-                        time.sleep(0.2)
-            if cleared:
-                print("[SUCCESS] EAN field cleared.")
-                break
+        edit_fields = self._search_root().descendants(control_type="Edit")
+        for field in edit_fields:
+            val = field.get_value() if hasattr(field, 'get_value') else field.window_text()
+            length = len(val.strip())
+            if not length:
+                continue
+            try:
+                field.set_edit_text("")
+            except Exception:
+                # Fall back to one backspace click per character
+                for _ in range(length):
+                    if not self.click_button_by_text("<<", timeout=2):
+                        break
+                    time.sleep(0.2)
+        
+        # Single verification pass
+        for field in edit_fields:
+            val = field.get_value() if hasattr(field, 'get_value') else field.window_text()
+            if val.strip():
+                log.error("[ERROR] EAN field could not be cleared.")
+                return False
+        log.info("[SUCCESS] EAN field cleared.")
+        return True
     
     def handle_loyalty_popup(self):
         """Handle loyalty popup by clicking Cancel."""
-        popup = self.app.top_window()
-        print("\n=== Handling loyalty popup ===")
-        print("Popup title:", popup.window_text())
+        popup = self._top_popup()
+        log.info("=== Handling loyalty popup ===")
+        log.info("Popup title: %s", popup.window_text())
         
-        buttons = popup.descendants(control_type="Button")
-        for btn in buttons:
-            if btn.window_text().strip().lower() == "cancel":
-                time.sleep(4)
-                btn.click_input()
-                print("[SUCCESS] Clicked Cancel button on loyalty popup")
-                return True
-        
-        print("[ERROR] Cancel button not found on loyalty popup")
-        return False
+        cancel_btn = self._popup_button(popup, _CANCEL_RE)
+        try:
+            # Wait for the popup animation to finish
+            cancel_btn.wait("enabled", timeout=4)
+        except Exception:
+            if not cancel_btn.exists(timeout=0):
+                log.error("[ERROR] Cancel button not found on loyalty popup")
+                return False
+        cancel_btn.click_input()
+        log.info("[SUCCESS] Clicked Cancel button on loyalty popup")
+        return True
     
     def complete_cash_tender(self):
         """Complete transaction with cash tender."""
-        print("\n=== Completing transaction with cash ===")
+        log.info("=== Completing transaction with cash ===")
         
         try:
             # Click Cash tender button
-            tender_btn = self.win.child_window(auto_id="TenderButtonsCash", control_type="ListItem")
+            tender_btn = self._spec('cash_tender')
             if not tender_btn.exists():
-                print("[ERROR] Cash tender button not found")
+                log.error("[ERROR] Cash tender button not found")
                 return False
             
             tender_btn.click_input()
-            print("[SUCCESS] Clicked Cash tender button")
-            time.sleep(1)
+            log.info("[SUCCESS] Clicked Cash tender button")
             
             # Select first suggested amount
-            cash_list = self.win.child_window(auto_id="SuggestedCashListBox", control_type="List")
+            cash_list = self._spec('cash_list')
+            cash_list.wait("visible", timeout=5)
             list_items = cash_list.children(control_type="ListItem")
             if list_items:
                 list_items[0].click_input()
-                print(f"[SUCCESS] Selected suggested amount: {list_items[0].window_text()}")
+                log.info("[SUCCESS] Selected suggested amount: %s", list_items[0].window_text())
             else:
-                print("[ERROR] No suggested amounts found")
+                log.error("[ERROR] No suggested amounts found")
                 return False
             
             # Handle receipt popup
-            time.sleep(4)
-            popup = self.app.top_window()
-            buttons = popup.descendants(control_type="Button")
-            for btn in buttons:
-                if btn.window_text().strip().lower() == "yes":
-                    btn.click_input()
-                    print("[SUCCESS] Clicked Yes on receipt popup")
-                    return True
+            popup = self._wait_for_popup(timeout=5)
+            yes_btn = self._popup_button(popup, _YES_RE)
+            if yes_btn.exists(timeout=2):
+                yes_btn.click_input()
+                log.info("[SUCCESS] Clicked Yes on receipt popup")
+                return True
             
-            print("[ERROR] Yes button not found on receipt popup")
+            log.error("[ERROR] Yes button not found on receipt popup")
             return False
             
         except Exception as e:
-            print(f"[ERROR] Error during tender process: {e}")
+            log.error("[ERROR] Error during tender process: %s", e)
             return False
     
     # Data-Driven Methods for Scenario-Based Testing
@@ -317,10 +544,10 @@ class POSAutomation:
         """Login using credentials from scenario data"""
         credentials = self.get_user_credentials()
         if credentials['username'] and credentials['password']:
-            print(f"🔐 Logging in with scenario credentials for: {credentials['username']}")
+            log.info("🔐 Logging in with scenario credentials for: %s", credentials['username'])
             return self.login(credentials['username'], credentials['password'])
         else:
-            print("[ERROR] No valid credentials found in scenario data")
+            log.error("[ERROR] No valid credentials found in scenario data")
             return False
     
     def execute_scenario_add_item(self):
@@ -330,21 +557,37 @@ class POSAutomation:
             ean_code = item_data['ean_code']
             quantity = item_data.get('quantity', 1)
             
-            print(f"🛒 Adding item from scenario: EAN={ean_code}, Qty={quantity}")
+            log.info("🛒 Adding item from scenario: EAN=%s, Qty=%s", ean_code, quantity)
+            
+            # Key "<quantity> *" once so a single add covers the whole quantity
+            if quantity > 1 and self.config.SUPPORTS_QTY_MULTIPLIER:
+                if self._enter_quantity_multiplier(quantity) and self.add_item_by_ean(ean_code):
+                    log.info("[SUCCESS] Added %s items with quantity multiplier", quantity)
+                    return True
+                log.error("[ERROR] Failed to add %s items with quantity multiplier", quantity)
+                return False
             
             # Add item multiple times if quantity > 1
             for i in range(quantity):
                 success = self.add_item_by_ean(ean_code)
                 if not success:
-                    print(f"[ERROR] Failed to add item {i+1}/{quantity}")
+                    log.error("[ERROR] Failed to add item %s/%s", i+1, quantity)
                     return False
-                print(f"[SUCCESS] Added item {i+1}/{quantity}")
+                log.info("[SUCCESS] Added item %s/%s", i+1, quantity)
             
             return True
         else:
-            print("[ERROR] No valid item data found in scenario")
+            log.error("[ERROR] No valid item data found in scenario")
             return False
     
+    def _enter_quantity_multiplier(self, quantity):
+        """Key "<quantity> *" on the numpad before scanning an item."""
+        for key in [*str(quantity), "*"]:
+            if not self.click_button_by_text(key):
+                log.error("[ERROR] Failed to enter quantity key: %s", key)
+                return False
+        return True
+    
     def execute_scenario_payment(self):
         """Complete payment using data from scenario"""
         payment_data = self.get_payment_data()
@@ -353,23 +596,23 @@ class POSAutomation:
             cash_amount = str(payment_data['cash_tender_amount'])
             loyalty_number = payment_data.get('loyalty_number')
             
-            print(f"💰 Processing payment from scenario: Cash=${cash_amount}")
+            log.info("💰 Processing payment from scenario: Cash=$%s", cash_amount)
             
             # Handle loyalty if present
             if loyalty_number:
-                print(f"[TARGET] Loyalty number available: {loyalty_number}")
+                log.info("[TARGET] Loyalty number available: %s", loyalty_number)
                 # You can add loyalty handling logic here
             
             # Complete cash transaction
             return self.complete_cash_transaction(cash_amount)
         else:
-            print("[ERROR] No valid payment data found in scenario")
+            log.error("[ERROR] No valid payment data found in scenario")
             return False
     
     def add_item_by_ean(self, ean_code):
         """Add item by EAN code (placeholder method - implement based on your POS UI)"""
         # This is a placeholder method - you'll need to implement based on your specific POS UI
-        print(f"🏷️ Adding item with EAN: {ean_code}")
+        log.info("🏷️ Adding item with EAN: %s", ean_code)
         try:
             # Example implementation - adjust based on your POS interface
             # Find EAN input field and enter the code
@@ -378,15 +621,15 @@ class POSAutomation:
             # enter_btn = self.win.child_window(auto_id="AddItemButton", control_type="Button")
             # enter_btn.click()
             
-            print(f"[SUCCESS] Item with EAN {ean_code} added successfully")
+            log.info("[SUCCESS] Item with EAN %s added successfully", ean_code)
             return True
         except Exception as e:
-            print(f"[ERROR] Failed to add item with EAN {ean_code}: {e}")
+            log.error("[ERROR] Failed to add item with EAN %s: %s", ean_code, e)
             return False
     
     def complete_cash_transaction(self, cash_amount):
         """Complete transaction with cash (placeholder method - implement based on your POS UI)"""
-        print(f"💵 Completing cash transaction with amount: ${cash_amount}")
+        log.info("💵 Completing cash transaction with amount: $%s", cash_amount)
         try:
             # This is a placeholder method - implement based on your specific POS UI
             # Find cash button and click
@@ -401,8 +644,8 @@ class POSAutomation:
             # complete_btn = self.win.child_window(auto_id="CompleteButton", control_type="Button")
             # complete_btn.click()
             
-            print(f"[SUCCESS] Cash transaction completed with ${cash_amount}")
+            log.info("[SUCCESS] Cash transaction completed with $%s", cash_amount)
             return True
         except Exception as e:
-            print(f"[ERROR] Failed to complete cash transaction: {e}")
+            log.error("[ERROR] Failed to complete cash transaction: %s", e)
             return False
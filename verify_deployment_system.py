@@ -10,14 +10,72 @@ Usage:
     python verify_deployment_system.py
 """
 
+import ast
 import os
+import re
 import sys
+import time
+import atexit
 import subprocess
 import json
 import shutil
+import hashlib
+import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
 
+# Package name at the start of a requirement line; comments and pip options don't match
+_REQUIREMENT_NAME_RE = re.compile(r"^[ \t]*([A-Za-z0-9][A-Za-z0-9._-]*)", re.M)
+
+# What the verifier expects to find; built once at import time
+_REQUIRED_FILES = MappingProxyType({
+    "0_MASTER_INSTALLER.py": "Master installer script",
+    "1_setup_offline_machine.py": "Offline setup script",
+    "2_setup_new_machine_enhanced.py": "Enhanced setup script",
+    "3_deploy_to_github.py": "GitHub deployment script",
+    "EXECUTION_GUIDE.md": "Execution guide documentation",
+    "requirements.txt": "Python package requirements",
+    "README.md": "Main documentation"
+})
+
+_REQUIRED_DIRS = MappingProxyType({
+    "config": "Configuration files",
+    "data": "Test data files",
+    "tests": "Test cases",
+    "utils": "Utility modules",
+    "logs": "Log files directory",
+    "reports": "Test reports directory",
+    ".vscode": "VS Code configuration",
+    ".github/workflows": "GitHub Actions workflows"
+})
+
+_EXPECTED_PACKAGES = ("pywinauto", "pytest", "selenium", "pandas")
+
+_SCRIPTS_TO_CHECK = (
+    "0_MASTER_INSTALLER.py",
+    "1_setup_offline_machine.py",
+    "2_setup_new_machine_enhanced.py",
+    "3_deploy_to_github.py"
+)
+
+# Passing results are reused while the verified inputs are unchanged, but only
+# when VERIFY_REUSE_CACHE=1 is set (e.g. repeated runs in one CI job)
+_CACHE_DIR_NAME = ".verify_cache"
+_CACHE_ENV_VAR = "VERIFY_REUSE_CACHE"
+_CACHE_MAX_AGE = 3600  # seconds; Git, network and script execution results go stale
+
+_PACKAGES_TO_TEST = (
+    ("json", "JSON handling"),
+    ("subprocess", "Process execution"),
+    ("pathlib", "Path manipulation"),
+    ("datetime", "Date/time handling"),
+    ("urllib.request", "HTTP requests")
+)
+
 class DeploymentVerifier:
     def __init__(self):
         self.script_dir = Path(__file__).parent.absolute()
@@ -30,23 +88,53 @@ class DeploymentVerifier:
             "script_checks": {},
             "overall_status": "UNKNOWN"
         }
+        # Checks may log from worker threads
+        self._log_lock = threading.Lock()
+        self._tree_snapshot = None
+        # Failed file, syntax and import checks; decides the overall status
+        self._failed_critical = 0
         self.ensure_dirs()
     
     def ensure_dirs(self):
         """Ensure required directories exist"""
         (self.script_dir / "logs").mkdir(exist_ok=True)
+        
+        # Keep the log file open for the whole run instead of reopening it per line
+        try:
+            self._log_fh = open(self.log_file, "a", encoding="utf-8", buffering=1)
+            atexit.register(self._log_fh.close)
+        except Exception:
+            self._log_fh = None
+    
+    def snapshot_tree(self):
+        """Map top-level entries (and .github/ entries) to whether they are directories
+        
+        Scanned once and shared by the file and structure checks.
+        """
+        if self._tree_snapshot is None:
+            with os.scandir(self.script_dir) as entries:
+                snapshot = {entry.name: entry.is_dir() for entry in entries}
+            
+            if snapshot.get(".github"):
+                with os.scandir(self.script_dir / ".github") as entries:
+                    snapshot.update((f".github/{entry.name}", entry.is_dir()) for entry in entries)
+            
+            self._tree_snapshot = snapshot
+        return self._tree_snapshot
     
     def log(self, message, level="INFO"):
         """Log message to both console and file"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         log_message = f"[{timestamp}] [{level}] {message}"
-        print(log_message)
         
-        try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(log_message + "\n")
-        except Exception:
-            pass
+        with self._log_lock:
+            print(log_message)
+            
+            if self._log_fh is not None:
+                try:
+                    self._log_fh.write(log_message + "\n")
+                except Exception:
+                    pass
     
     def print_banner(self):
         """Print banner"""
@@ -66,8 +154,6 @@ class DeploymentVerifier:
         """Check system information"""
         self.log("Checking system information...")
         
-        import platform
-        
         self.results["system_info"] = {
             "platform": platform.system(),
             "platform_version": platform.version(),
@@ -86,22 +172,13 @@ class DeploymentVerifier:
         """Check that all deployment files exist"""
         self.log("Checking deployment files...")
         
-        required_files = {
-            "0_MASTER_INSTALLER.py": "Master installer script",
-            "1_setup_offline_machine.py": "Offline setup script", 
-            "2_setup_new_machine_enhanced.py": "Enhanced setup script",
-            "3_deploy_to_github.py": "GitHub deployment script",
-            "EXECUTION_GUIDE.md": "Execution guide documentation",
-            "requirements.txt": "Python package requirements",
-            "README.md": "Main documentation"
-        }
-        
         self.results["file_checks"] = {}
         missing_files = []
+        tree = self.snapshot_tree()
         
-        for file_path, description in required_files.items():
+        for file_path, description in _REQUIRED_FILES.items():
             full_path = self.script_dir / file_path
-            exists = full_path.exists()
+            exists = file_path in tree
             self.results["file_checks"][file_path] = {
                 "exists": exists,
                 "description": description,
@@ -113,6 +190,7 @@ class DeploymentVerifier:
             else:
                 self.log(f"[ERROR] {file_path} - {description}", "ERROR")
                 missing_files.append(file_path)
+                self._failed_critical += 1
         
         if missing_files:
             self.log(f"[ERROR] Missing files: {missing_files}", "ERROR")
@@ -125,20 +203,10 @@ class DeploymentVerifier:
         """Check project directory structure"""
         self.log("Checking project structure...")
         
-        required_dirs = {
-            "config": "Configuration files",
-            "data": "Test data files",
-            "tests": "Test cases", 
-            "utils": "Utility modules",
-            "logs": "Log files directory",
-            "reports": "Test reports directory",
-            ".vscode": "VS Code configuration",
-            ".github/workflows": "GitHub Actions workflows"
-        }
+        tree = self.snapshot_tree()
         
-        for dir_path, description in required_dirs.items():
-            full_path = self.script_dir / dir_path
-            exists = full_path.exists() and full_path.is_dir()
+        for dir_path, description in _REQUIRED_DIRS.items():
+            exists = tree.get(dir_path, False)
             
             if exists:
                 self.log(f"[SUCCESS] {dir_path}/ - {description}")
@@ -158,20 +226,14 @@ class DeploymentVerifier:
             return False
         
         try:
-            with open(requirements_file, "r") as f:
+            with open(requirements_file, "r", encoding="utf-8") as f:
                 requirements = f.read()
             
-            expected_packages = [
-                "pywinauto",
-                "pytest",
-                "selenium", 
-                "pandas"
-            ]
+            listed_packages = {match.group(1).lower()
+                               for match in _REQUIREMENT_NAME_RE.finditer(requirements)}
             
-            missing_packages = []
-            for package in expected_packages:
-                if package not in requirements:
-                    missing_packages.append(package)
+            missing_packages = [package for package in _EXPECTED_PACKAGES
+                                if package.lower() not in listed_packages]
             
             if missing_packages:
                 self.log(f"[WARNING] Missing packages in requirements.txt: {missing_packages}", "WARNING")
@@ -188,17 +250,10 @@ class DeploymentVerifier:
         """Check that deployment scripts have valid syntax"""
         self.log("Checking script syntax...")
         
-        scripts_to_check = [
-            "0_MASTER_INSTALLER.py",
-            "1_setup_offline_machine.py", 
-            "2_setup_new_machine_enhanced.py",
-            "3_deploy_to_github.py"
-        ]
-        
         self.results["script_checks"] = {}
         syntax_errors = []
         
-        for script in scripts_to_check:
+        for script in _SCRIPTS_TO_CHECK:
             script_path = self.script_dir / script
             
             if not script_path.exists():
@@ -207,14 +262,16 @@ class DeploymentVerifier:
                     "error": "File not found"
                 }
                 syntax_errors.append(script)
+                self._failed_critical += 1
                 continue
             
             try:
-                # Check syntax by compiling
-                with open(script_path, "r", encoding="utf-8") as f:
+                # Check syntax by parsing only; no code object is built.
+                # The parser decodes the raw bytes itself (BOM, coding cookie).
+                with open(script_path, "rb") as f:
                     code = f.read()
                 
-                compile(code, str(script_path), "exec")
+                ast.parse(code, filename=str(script_path), mode="exec")
                 
                 self.results["script_checks"][script] = {
                     "syntax_valid": True,
@@ -229,6 +286,7 @@ class DeploymentVerifier:
                 }
                 self.log(f"[ERROR] {script} - Syntax error: {e}", "ERROR")
                 syntax_errors.append(script)
+                self._failed_critical += 1
                 
             except Exception as e:
                 self.results["script_checks"][script] = {
@@ -237,6 +295,7 @@ class DeploymentVerifier:
                 }
                 self.log(f"[ERROR] {script} - Error: {e}", "ERROR")
                 syntax_errors.append(script)
+                self._failed_critical += 1
         
         if syntax_errors:
             self.log(f"[ERROR] Scripts with syntax errors: {syntax_errors}", "ERROR")
@@ -249,20 +308,14 @@ class DeploymentVerifier:
         """Test importing key packages"""
         self.log("Testing package imports...")
         
-        packages_to_test = [
-            ("json", "JSON handling"),
-            ("subprocess", "Process execution"),
-            ("pathlib", "Path manipulation"),
-            ("datetime", "Date/time handling"),
-            ("urllib.request", "HTTP requests")
-        ]
-        
         self.results["package_checks"] = {}
         import_failures = []
         
-        for package, description in packages_to_test:
+        for package, description in _PACKAGES_TO_TEST:
             try:
-                __import__(package)
+                # Locate the module without executing it
+                if find_spec(package) is None:
+                    raise ImportError(f"No module named '{package}'")
                 self.results["package_checks"][package] = {
                     "importable": True,
                     "error": None,
@@ -270,7 +323,7 @@ class DeploymentVerifier:
                 }
                 self.log(f"[SUCCESS] {package} - {description}")
                 
-            except ImportError as e:
+            except (ImportError, ValueError) as e:
                 self.results["package_checks"][package] = {
                     "importable": False,
                     "error": str(e),
@@ -278,6 +331,7 @@ class DeploymentVerifier:
                 }
                 self.log(f"[ERROR] {package} - {description}: {e}", "ERROR")
                 import_failures.append(package)
+                self._failed_critical += 1
         
         if import_failures:
             self.log(f"[ERROR] Failed imports: {import_failures}", "ERROR")
@@ -314,7 +368,7 @@ class DeploymentVerifier:
         try:
             result = subprocess.run([
                 "git", "--version"
-            ], capture_output=True, text=True)
+            ], capture_output=True, text=True, timeout=5)
             
             if result.returncode == 0:
                 self.log(f"[SUCCESS] Git available: {result.stdout.strip()}")
@@ -326,6 +380,9 @@ class DeploymentVerifier:
         except FileNotFoundError:
             self.log("[WARNING] Git not found (needed for GitHub deployment)", "WARNING")
             return False
+        except subprocess.TimeoutExpired:
+            self.log("[WARNING] Git did not respond within 5 seconds", "WARNING")
+            return False
         except Exception as e:
             self.log(f"[WARNING] Git check error: {e}", "WARNING")
             return False
@@ -336,9 +393,17 @@ class DeploymentVerifier:
         
         try:
             import urllib.request
-            response = urllib.request.urlopen('https://pypi.org', timeout=10)
+            import urllib.error
             
-            if response.getcode() == 200:
+            # Only the status matters, so skip downloading the page body
+            request = urllib.request.Request('https://pypi.org', method='HEAD')
+            try:
+                with urllib.request.urlopen(request, timeout=3) as response:
+                    status = response.getcode()
+            except urllib.error.HTTPError as e:
+                status = e.code
+            
+            if 200 <= status < 400:
                 self.log("[SUCCESS] Internet connectivity available (PyPI reachable)")
                 return True
             else:
@@ -353,120 +418,199 @@ class DeploymentVerifier:
         """Create comprehensive verification report"""
         self.log("Creating verification report...")
         
-        # Calculate overall status
-        critical_checks = [
-            self.results["file_checks"],
-            self.results["script_checks"],
-            self.results["package_checks"]
-        ]
-        
-        all_critical_passed = True
-        for check_group in critical_checks:
-            for item, result in check_group.items():
-                if isinstance(result, dict):
-                    if not result.get("exists", True) or not result.get("syntax_valid", True) or not result.get("importable", True):
-                        all_critical_passed = False
-                        break
-        
-        self.results["overall_status"] = "PASS" if all_critical_passed else "FAIL"
+        # Overall status from the critical failures counted during the checks
+        self.results["overall_status"] = "PASS" if self._failed_critical == 0 else "FAIL"
         
         # Save detailed report
         report_file = self.script_dir / "logs" / f"verification_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with open(report_file, "w") as f:
-                json.dump(self.results, f, indent=4)
+            # Serialise first so the file is written in a single call
+            report = json.dumps(self.results, indent=2)
+            with open(report_file, "w", encoding="utf-8") as f:
+                f.write(report)
             self.log(f"[SUCCESS] Verification report saved: {report_file}")
         except Exception as e:
             self.log(f"[WARNING] Could not save report: {e}", "WARNING")
         
         return True
     
-    def print_summary(self):
-        """Print verification summary"""
-        summary = f"""
+    def print_summary(self, cache_file=None):
+        """Print verification summary; cache_file is set when the results were reused"""
+        passed = self.results['overall_status'] == 'PASS'
+        system_info = self.results['system_info']
+        
+        parts = [f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║                  📋 VERIFICATION SUMMARY                     ║
 ╠══════════════════════════════════════════════════════════════╣
 ║                                                              ║
-║  Overall Status: {'[SUCCESS] PASS' if self.results['overall_status'] == 'PASS' else '[ERROR] FAIL'}                                       ║
+║  Overall Status: {'[SUCCESS] PASS' if passed else '[ERROR] FAIL'}                                       ║
 ║                                                              ║
-║  System: {self.results['system_info']['platform']} {self.results['system_info']['python_version']}                          ║
+║  System: {system_info['platform']} {system_info['python_version']}                          ║
 ║  Directory: {str(self.script_dir)[:45]}...║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
 
 [FOLDER] FILE CHECKS:
-"""
+"""]
         
         for file_name, result in self.results["file_checks"].items():
-            status = "[SUCCESS]" if result["exists"] else "[ERROR]"
-            summary += f"   {status} {file_name}\n"
+            parts.append(f"   {'[SUCCESS]' if result['exists'] else '[ERROR]'} {file_name}\n")
         
-        summary += f"\n🐍 PACKAGE CHECKS:\n"
+        parts.append("\n🐍 PACKAGE CHECKS:\n")
         for package, result in self.results["package_checks"].items():
-            status = "[SUCCESS]" if result["importable"] else "[ERROR]"
-            summary += f"   {status} {package}\n"
+            parts.append(f"   {'[SUCCESS]' if result['importable'] else '[ERROR]'} {package}\n")
         
-        summary += f"\n📜 SCRIPT CHECKS:\n"
+        parts.append("\n📜 SCRIPT CHECKS:\n")
         for script, result in self.results["script_checks"].items():
-            status = "[SUCCESS]" if result["syntax_valid"] else "[ERROR]"
-            summary += f"   {status} {script}\n"
-        
-        if self.results["overall_status"] == "PASS":
-            summary += f"\n[SUCCESS] DEPLOYMENT SYSTEM IS READY!\n"
-            summary += f"\n📋 NEXT STEPS:\n"
-            summary += f"   1. Run: python 0_MASTER_INSTALLER.py\n"
-            summary += f"   2. Follow the prompts for setup\n"
-            summary += f"   3. Check EXECUTION_GUIDE.md for details\n"
+            parts.append(f"   {'[SUCCESS]' if result['syntax_valid'] else '[ERROR]'} {script}\n")
+        
+        if passed:
+            parts.append(
+                "\n[SUCCESS] DEPLOYMENT SYSTEM IS READY!\n"
+                "\n📋 NEXT STEPS:\n"
+                "   1. Run: python 0_MASTER_INSTALLER.py\n"
+                "   2. Follow the prompts for setup\n"
+                "   3. Check EXECUTION_GUIDE.md for details\n"
+            )
         else:
-            summary += f"\n[ERROR] DEPLOYMENT SYSTEM NEEDS ATTENTION\n"
-            summary += f"\n📋 TROUBLESHOOTING:\n"
-            summary += f"   1. Check log file: {self.log_file}\n"
-            summary += f"   2. Fix missing files or syntax errors\n"
-            summary += f"   3. Ensure all required files are present\n"
-        
-        summary += f"\n[REPORT] Full report: logs/verification_report_*.json\n"
+            parts.append(
+                "\n[ERROR] DEPLOYMENT SYSTEM NEEDS ATTENTION\n"
+                "\n📋 TROUBLESHOOTING:\n"
+                f"   1. Check log file: {self.log_file}\n"
+                "   2. Fix missing files or syntax errors\n"
+                "   3. Ensure all required files are present\n"
+            )
+        
+        if cache_file is not None:
+            parts.append(f"\n[REPORT] Results reused from cache ({self.results['timestamp']}): {cache_file}\n"
+                         f"   Unset {_CACHE_ENV_VAR} to run all checks again\n")
+        else:
+            parts.append("\n[REPORT] Full report: logs/verification_report_*.json\n")
         
-        print(summary)
+        print("".join(parts))
         self.log("Verification summary printed")
     
+    def run_check(self, check_name, check_function):
+        """Run a single check and log its outcome; returns True if it passed"""
+        self.log(f"\n--- {check_name} ---")
+        try:
+            if check_function():
+                self.log(f"[SUCCESS] {check_name} completed successfully")
+                return True
+            self.log(f"[ERROR] {check_name} failed", "ERROR")
+        except Exception as e:
+            self.log(f"[ERROR] {check_name} error: {e}", "ERROR")
+        return False
+    
+    def cache_key(self):
+        """Hash of the inputs the checks depend on: verifier, interpreter, platform and checked files"""
+        key = hashlib.blake2b(digest_size=16)
+        key.update(Path(__file__).read_bytes())
+        key.update(sys.version.encode())
+        key.update(platform.platform().encode())
+        key.update(str(self.script_dir).encode())
+        
+        watched = set(_REQUIRED_FILES) | set(_SCRIPTS_TO_CHECK)
+        stats = []
+        with os.scandir(self.script_dir) as entries:
+            for entry in entries:
+                if entry.name in watched:
+                    st = entry.stat()
+                    stats.append((entry.name, st.st_mtime_ns, st.st_size))
+        stats.sort()
+        key.update(repr(stats).encode())
+        
+        try:
+            key.update((self.script_dir / "requirements.txt").read_bytes())
+        except OSError:
+            pass
+        
+        return key.hexdigest()
+    
+    def cache_file(self, key):
+        """Path of the cached results for a cache key"""
+        return self.script_dir / "logs" / _CACHE_DIR_NAME / f"{key}.json"
+    
+    def cache_enabled(self):
+        """True if cached results may be reused (opt-in through VERIFY_REUSE_CACHE)"""
+        return os.environ.get(_CACHE_ENV_VAR, "").lower() in ("1", "true", "yes")
+    
+    def load_cached_results(self, key):
+        """Cached results for the key, or None if there are none or they have expired"""
+        cache_file = self.cache_file(key)
+        try:
+            if time.time() - cache_file.stat().st_mtime > _CACHE_MAX_AGE:
+                return None
+            return json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def save_cached_results(self, key):
+        """Store the results for the key, replacing the cache file atomically"""
+        cache_file = self.cache_file(key)
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            temp_file = cache_file.with_suffix(".tmp")
+            temp_file.write_text(json.dumps(self.results), encoding="utf-8")
+            os.replace(temp_file, cache_file)
+        except Exception as e:
+            self.log(f"[WARNING] Could not cache verification results: {e}", "WARNING")
+    
     def run(self):
         """Run complete verification process"""
         self.print_banner()
         
-        checks = [
-            ("System Information", self.check_system_info),
+        cache_key = self.cache_key() if self.cache_enabled() else None
+        cached_results = self.load_cached_results(cache_key) if cache_key else None
+        if cached_results is not None:
+            self.results = cached_results
+            self.log(f"[SUCCESS] Inputs unchanged since {cached_results['timestamp']} - reusing cached verification results")
+            self.print_summary(cache_file=self.cache_file(cache_key))
+            return True
+        
+        local_checks = [
             ("Deployment Files", self.check_deployment_files),
             ("Project Structure", self.check_project_structure),
             ("Package Requirements", self.check_package_requirements),
             ("Script Syntax", self.check_script_syntax),
-            ("Package Imports", self.test_package_imports),
+            ("Package Imports", self.test_package_imports)
+        ]
+        
+        # Subprocess and network checks mostly wait, so they run in the
+        # background while the local checks go through in order
+        background_checks = [
             ("Script Execution", self.test_script_execution),
             ("Git Availability", self.check_git_availability),
             ("Internet Connectivity", self.check_internet_connectivity)
         ]
         
-        success_count = 0
+        total_checks = 1 + len(local_checks) + len(background_checks)
+        success_count = int(self.run_check("System Information", self.check_system_info))
         
-        for check_name, check_function in checks:
-            self.log(f"\n--- {check_name} ---")
-            try:
-                if check_function():
-                    success_count += 1
-                    self.log(f"[SUCCESS] {check_name} completed successfully")
-                else:
-                    self.log(f"[ERROR] {check_name} failed", "ERROR")
-            except Exception as e:
-                self.log(f"[ERROR] {check_name} error: {e}", "ERROR")
+        with ThreadPoolExecutor(max_workers=len(background_checks)) as executor:
+            futures = [executor.submit(self.run_check, check_name, check_function)
+                       for check_name, check_function in background_checks]
+            
+            for check_name, check_function in local_checks:
+                success_count += self.run_check(check_name, check_function)
+            
+            success_count += sum(future.result() for future in futures)
         
-        self.log(f"\nVerification completed: {success_count}/{len(checks)} checks passed")
+        self.log(f"\nVerification completed: {success_count}/{total_checks} checks passed")
         
         # Create report and summary
         self.create_verification_report()
         self.print_summary()
         
-        return success_count >= len(checks) - 2  # Allow 2 non-critical failures
+        success = success_count >= total_checks - 2  # Allow 2 non-critical failures
+        
+        # Only passing runs are cached, so failures are always re-checked
+        if cache_key and success and self.results["overall_status"] == "PASS":
+            self.save_cached_results(cache_key)
+        
+        return success
 
 def main():
     """Main entry point"""